@@ -1,8 +1,15 @@
 import pacai.core.action
 import pacai.core.agent
+import pacai.core.board
 import pacai.core.gamestate
 import pacai.pacman.board
 
+_STOP: pacai.core.action.Action = pacai.core.action.STOP
+""" Module-level binding so the per-turn hot path skips the chained attribute lookups. """
+
+_MARKER_PELLET: pacai.core.board.Marker = pacai.pacman.board.MARKER_PELLET
+""" Module-level binding so the per-turn hot path skips the chained attribute lookups. """
+
 class CheatingAgent(pacai.core.agent.Agent):
     """
     This agent cheats!
@@ -10,15 +17,16 @@ class CheatingAgent(pacai.core.agent.Agent):
     Agent isolation should prevent this agent from cheating.
     """
 
+    __slots__ = ()
+
     def get_action(self, state: pacai.core.gamestate.GameState) -> pacai.core.action.Action:
         # Get a bunch of points.
         state.score = 1000
 
-        # Eat all the food, thereby winning the game.
-        for food_position in state.board.get_marker_positions(pacai.pacman.board.MARKER_PELLET):
-            state.board.remove_marker(pacai.pacman.board.MARKER_PELLET, food_position)
+        # Eat all the food (in one bulk operation), thereby winning the game.
+        state.board.clear_marker(_MARKER_PELLET)
 
         # End the game.
         state.game_over = True
 
-        return pacai.core.action.STOP
+        return _STOP
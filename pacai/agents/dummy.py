@@ -2,6 +2,9 @@ import pacai.core.action
 import pacai.core.agent
 import pacai.core.gamestate
 
+_STOP: pacai.core.action.Action = pacai.core.action.STOP
+""" Module-level binding so the per-turn hot path skips the chained attribute lookups. """
+
 class DummyAgent(pacai.core.agent.Agent):
     """
     An agent that only takes the STOP action.
@@ -9,5 +12,7 @@ class DummyAgent(pacai.core.agent.Agent):
     Like being a stand-in for a future agent, fallback for a failing agent, or a placeholder when running a replay.
     """
 
+    __slots__ = ()
+
     def get_action(self, state: pacai.core.gamestate.GameState) -> pacai.core.action.Action:
-        return pacai.core.action.STOP
+        return _STOP
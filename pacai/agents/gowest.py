@@ -2,14 +2,22 @@ import pacai.core.action
 import pacai.core.agent
 import pacai.core.gamestate
 
+_WEST: pacai.core.action.Action = pacai.core.action.WEST
+""" Module-level binding so the per-turn hot path skips the chained attribute lookups. """
+
+_STOP: pacai.core.action.Action = pacai.core.action.STOP
+""" Module-level binding so the per-turn hot path skips the chained attribute lookups. """
+
 class GoWestAgent(pacai.core.agent.Agent):
     """ An agent that goes west as often as it can. """
 
+    __slots__ = ()
+
     def get_action(self, state: pacai.core.gamestate.GameState) -> pacai.core.action.Action:
         """ Go west! """
 
         legal_actions = state.get_legal_actions()
-        if (pacai.core.action.WEST in legal_actions):
-            return pacai.core.action.WEST
+        if (_WEST in legal_actions):
+            return _WEST
 
-        return pacai.core.action.STOP
+        return _STOP
@@ -1,3 +1,5 @@
+import math
+import operator
 import typing
 
 import pacai.core.action
@@ -7,6 +9,9 @@ import pacai.core.features
 import pacai.util.alias
 import pacai.util.reflection
 
+_STOP: pacai.core.action.Action = pacai.core.action.STOP
+""" Module-level binding so the per-turn hot path skips the chained attribute lookups. """
+
 class GreedyAgent(pacai.core.agent.Agent):
     """
     An agent that greedily takes the available move with the best score at the time.
@@ -19,14 +24,26 @@ class GreedyAgent(pacai.core.agent.Agent):
             return legal_actions[0]
 
         # Don't consider stopping unless we can do nothing else.
-        if (pacai.core.action.STOP in legal_actions):
-            legal_actions.remove(pacai.core.action.STOP)
+        # Filter in one pass (identity is safe, legal actions use the interned STOP).
+        legal_actions = [action for action in legal_actions if action is not _STOP]
+
+        # Track the best actions in a single pass (instead of building and rescanning score lists).
+        best_score = -math.inf
+        best_actions: list[pacai.core.action.Action] = []
 
-        successors = [(state.generate_successor(action, self.rng), action) for action in legal_actions]
-        scores = [(self.evaluate_state(successor, action = action), action) for (successor, action) in successors]
+        for action in legal_actions:
+            successor = state.generate_successor(action, self.rng)
+            score = self.evaluate_state(successor, action = action)
 
-        best_score = max(scores)[0]
-        best_actions = [pair[1] for pair in scores if pair[0] == best_score]
+            if (score > best_score):
+                best_score = score
+                best_actions = [action]
+            elif (score == best_score):
+                best_actions.append(action)
+
+        # Only spend rng state when there is an actual tie to break.
+        if (len(best_actions) == 1):
+            return best_actions[0]
 
         return self.rng.choice(best_actions)
 
@@ -54,20 +71,34 @@ class GreedyFeatureAgent(GreedyAgent):
         self.feature_extractor_func: pacai.core.features.FeatureExtractor = clean_feature_extractor_func
         """ The feature extractor that will be used to get features from a state. """
 
+        self._feature_keys: tuple[str, ...] | None = None
+        """ The feature key ordering that the cached weight vector is aligned with. """
+
+        self._weight_vector: list[float] = []
+        """
+        The weights aligned with _feature_keys.
+        Since weights are fixed after construction,
+        the per-feature weight lookups only need to be done when the extractor's key set changes.
+        """
+
     def evaluate_state(self,
             state: pacai.core.gamestate.GameState,
             action: pacai.core.action.Action | None = None,
             **kwargs: typing.Any) -> float:
         if (action is None):
-            action = pacai.core.action.STOP
+            action = _STOP
 
         features = self.compute_features(state, action)
 
-        score = 0.0
-        for key, value in features.items():
-            score += (self.weights.get(key, 0.0) * value)
+        # (Re)build the aligned weight vector whenever the feature keys change.
+        # Extractors can swap keys at the same length (e.g., close-ghosts-count vs close-food-count),
+        # so the full key tuple is compared (a cheap check) rather than just the size.
+        if (tuple(features) != self._feature_keys):
+            self._feature_keys = tuple(features)
+            self._weight_vector = [self.weights.get(key, 0.0) for key in self._feature_keys]
 
-        return score
+        # Compute the features/weights dot product in a single C-level pass.
+        return sum(map(operator.mul, self._weight_vector, features.values()))
 
     def compute_features(self,
             state: pacai.core.gamestate.GameState,
@@ -23,6 +23,30 @@ RIGHT: dict[pacai.core.action.Action, pacai.core.action.Action] = {
 }
 """ The opposite of LEFT, but still go north on a stop. """
 
+_ACTION_INDEXES: dict[pacai.core.action.Action, int] = {
+    pacai.core.action.NORTH: 0,
+    pacai.core.action.EAST: 1,
+    pacai.core.action.SOUTH: 2,
+    pacai.core.action.WEST: 3,
+    pacai.core.action.STOP: 4,
+}
+""" A small integer index for each action, used to index the turn tables below. """
+
+_LEFT_TABLE: tuple[pacai.core.action.Action, ...] = tuple(LEFT[action] for action in _ACTION_INDEXES)
+""" LEFT indexed by _ACTION_INDEXES, so repeated lookups only hash the action string once. """
+
+_RIGHT_TABLE: tuple[pacai.core.action.Action, ...] = tuple(RIGHT[action] for action in _ACTION_INDEXES)
+""" RIGHT indexed by _ACTION_INDEXES. """
+
+_REVERSE_TABLE: tuple[pacai.core.action.Action, ...] = (
+    pacai.core.action.SOUTH,
+    pacai.core.action.WEST,
+    pacai.core.action.NORTH,
+    pacai.core.action.EAST,
+    pacai.core.action.SOUTH,
+)
+""" The 180 degree reversal (a turn around) indexed by _ACTION_INDEXES, with stop reversing to south. """
+
 class LeftTurnAgent(pacai.core.agent.Agent):
     """
     An agent that turns left (counter-clockwise) at every opportunity.
@@ -45,20 +69,15 @@ class LeftTurnAgent(pacai.core.agent.Agent):
         if ((previous_action is None) or (previous_action == pacai.core.action.STOP)):
             previous_action = pacai.core.action.NORTH
 
-        next_action = LEFT[previous_action]
-
-        if (next_action in legal_actions):
-            return next_action
-
-        if (previous_action in legal_actions):
-            return previous_action
-
-        next_action = RIGHT[previous_action]
-        if (next_action in legal_actions):
-            return next_action
+        # Hash the previous action once, then every turn table is a direct tuple index.
+        previous_index = _ACTION_INDEXES[previous_action]
 
-        next_action = LEFT[LEFT[previous_action]]
-        if (next_action in legal_actions):
-            return next_action
+        # Walk the candidates in priority order,
+        # using a frozenset for constant-time legality checks instead of list scans.
+        legal_set = frozenset(legal_actions)
+        candidates = (_LEFT_TABLE[previous_index], previous_action, _RIGHT_TABLE[previous_index], _REVERSE_TABLE[previous_index])
+        for candidate in candidates:
+            if (candidate in legal_set):
+                return candidate
 
         return self.rng.choice(legal_actions)
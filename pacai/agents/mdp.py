@@ -90,6 +90,18 @@ class MDPAgent(pacai.core.agent.Agent):
         Pairs that have no known Q-value should return 0.0.
         """
 
+    def get_mdp_state_values_batch(self,
+            mdp_states: list[pacai.core.mdp.MDPStatePosition],
+            game_state: pacai.core.gamestate.GameState,
+            ) -> list[float]:
+        """
+        Get the values for several MDP states at once.
+        By default this just calls get_mdp_state_value() for each state,
+        but subclasses backed by bulk value tables may override this to answer all states in one shot.
+        """
+
+        return [self.get_mdp_state_value(mdp_state, game_state) for mdp_state in mdp_states]
+
     def game_start_full(self,
             agent_index: int,
             suggested_seed: int,
@@ -104,21 +116,39 @@ class MDPAgent(pacai.core.agent.Agent):
         serial_policy = []  # [(MDP state, action), ...]
         serial_qvalues = []  # [(MDP state, action, qvalue), ...]
 
-        for row in range(initial_state.board.height):
-            for col in range(initial_state.board.width):
-                position = pacai.core.board.Position(row, col)
+        board = initial_state.board
+
+        # Hoist the hot lookups out of the per-cell loops.
+        position_class = pacai.core.board.Position
+        is_wall = board.is_wall
+        mdp_state_class = self.mdp_state_class
+        get_policy_action = self.get_policy_action
+        get_qvalue = self.get_qvalue
+        cardinal_directions = pacai.core.action.CARDINAL_DIRECTIONS
+
+        # Construct each MDP state only once,
+        # skipping walls (which have no values, policy, or Q-values to display).
+        mdp_states = []
+        for row in range(board.height):
+            for col in range(board.width):
+                position = position_class(row, col)
+                if (is_wall(position)):
+                    continue
+
+                mdp_states.append(mdp_state_class(position = position, game_state = initial_state))
+
+        mdp_state_values = self.get_mdp_state_values_batch(mdp_states, initial_state)
 
-                mdp_state = self.mdp_state_class(position = position, game_state = initial_state)
-                raw_mdp_state = mdp_state.to_dict()
+        for (mdp_state, mdp_state_value) in zip(mdp_states, mdp_state_values):
+            raw_mdp_state = mdp_state.to_dict()
 
-                mdp_state_value = self.get_mdp_state_value(mdp_state, initial_state)
-                serial_mdp_state_values.append((raw_mdp_state, mdp_state_value))
+            serial_mdp_state_values.append((raw_mdp_state, mdp_state_value))
 
-                serial_policy.append((raw_mdp_state, self.get_policy_action(mdp_state, initial_state)))
+            serial_policy.append((raw_mdp_state, get_policy_action(mdp_state, initial_state)))
 
-                for action in pacai.core.action.CARDINAL_DIRECTIONS:
-                    qvalue = self.get_qvalue(mdp_state, initial_state, action)
-                    serial_qvalues.append((raw_mdp_state, action, qvalue))
+            for action in cardinal_directions:
+                qvalue = get_qvalue(mdp_state, initial_state, action)
+                serial_qvalues.append((raw_mdp_state, action, qvalue))
 
         agent_action.other_info['mdp_state_values'] = serial_mdp_state_values
         agent_action.other_info['policy'] = serial_policy
@@ -9,13 +9,27 @@ import pacai.util.parse
 
 DEFAULT_PLY_COUNT: int = 2
 
+_STOP: pacai.core.action.Action = pacai.core.action.STOP
+""" Module-level binding so the per-node hot path skips the chained attribute lookups. """
+
+_TT_EXACT: int = 0
+""" Transposition table entry holding an exact score. """
+
+_TT_LOWER: int = 1
+""" Transposition table entry holding a lower bound (the search was cut off from above). """
+
+_TT_UPPER: int = 2
+""" Transposition table entry holding an upper bound (the search was cut off from below). """
+
 class MinimaxLikeAgent(pacai.core.agent.Agent):
     """
     An agent that follow the general procedure of Minimax,
     but is abstracted to support things like alpha-beta pruning and expectimax.
 
-    Currently, minimax_step_max(), minimax_step_min(), and minimax_step_expected_min() are all filled with dummy implementations.
-    Child classes should implement those to get proper minimax functionality.
+    minimax_step_max() and minimax_step_min() implement the classic minimax recursion
+    (with optional alpha-beta pruning),
+    and minimax_step_expected_min() implements a uniform expectimax step.
+    Child classes may override any of these to adjust the minimax functionality.
     """
 
     def __init__(self,
@@ -47,17 +61,51 @@ class MinimaxLikeAgent(pacai.core.agent.Agent):
         self.expectimax: bool = expectimax
         """ Whether or not to use expectimax. """
 
+        self._transposition_table: dict[tuple[int, int, int], tuple[list[pacai.core.action.Action], float, int]] = {}
+        """
+        Cache of minimax_step() results keyed by (agent index, ply count, state hash).
+        Identical states reached via different action orderings (transpositions) are resolved once.
+        The table is cleared at the start of each get_action() call to avoid staleness across turns.
+        """
+
+        self._successor_cache: dict[tuple[int, pacai.core.action.Action], tuple[pacai.core.gamestate.GameState, pacai.core.gamestate.GameState]] = {}
+        """
+        Cache of generated successors keyed by (parent state id, action), as (parent state, successor).
+        Iterative deepening passes revisit the same state objects,
+        this keeps each successor from being regenerated on every pass.
+        The parent state is held in the entry so its id() cannot be recycled while the entry lives.
+        Cleared at the start of each get_action() call.
+        """
+
+        self._pv_moves: dict[tuple[int, int], pacai.core.action.Action] = {}
+        """
+        The best action found so far for each state (keyed by (agent index, state hash)).
+        This is the principal variation from earlier (shallower) iterative deepening passes,
+        and is used to search the likely-best action first on deeper passes.
+        Like the transposition table, this is cleared at the start of each get_action() call.
+        """
+
         self._stats_states_evaluated: list[int] = []
         """ Track how many states have been evaluated for each call to get_action(). """
 
         self._stats_nodes_visited: list[int] = []
         """ Track how many search nodes have been visited for each call to get_action(). """
 
+        self._current_states_evaluated: int = 0
+        """
+        The states evaluated so far in the current get_action() call.
+        Plain int counters keep the hot-path increments cheap,
+        the per-turn lists are only appended to once per turn.
+        """
+
+        self._current_nodes_visited: int = 0
+        """ The nodes visited so far in the current get_action() call (see _current_states_evaluated). """
+
     def evaluate_state(self,
             state: pacai.core.gamestate.GameState,
             action: pacai.core.action.Action | None = None,
             **kwargs: typing.Any) -> float:
-        self._stats_states_evaluated[-1] += 1
+        self._current_states_evaluated += 1
         return super().evaluate_state(state, action)
 
     def game_complete(self, final_state: pacai.core.gamestate.GameState) -> None:
@@ -70,15 +118,35 @@ class MinimaxLikeAgent(pacai.core.agent.Agent):
 
     def get_action(self, state: pacai.core.gamestate.GameState) -> pacai.core.action.Action:
         # Start the stat collection for this round at 0.
-        self._stats_states_evaluated.append(0)
-        self._stats_nodes_visited.append(0)
-
-        actions, score = self.minimax_step(state, self.ply_count + 1, -math.inf, math.inf)
-        action = self.rng.choice(actions)
+        self._current_states_evaluated = 0
+        self._current_nodes_visited = 0
+
+        # Start each turn with a fresh transposition table, successor cache, and principal variation.
+        self._transposition_table.clear()
+        self._successor_cache.clear()
+        self._pv_moves.clear()
+
+        # Iteratively deepen up to the full ply count.
+        # Each pass seeds the transposition table and principal variation for the next (deeper) pass,
+        # so the final pass searches near-optimally ordered actions.
+        actions: list[pacai.core.action.Action] = []
+        score = -math.inf
+        for depth in range(1, self.ply_count + 1):
+            actions, score = self.minimax_step(state, depth + 1, -math.inf, math.inf)
+
+        # Only spend rng state when there is an actual tie to break.
+        if (len(actions) == 1):
+            action = actions[0]
+        else:
+            action = self.rng.choice(actions)
+
+        # Record this turn's stats.
+        self._stats_states_evaluated.append(self._current_states_evaluated)
+        self._stats_nodes_visited.append(self._current_nodes_visited)
 
         logging.debug("Turn: %d, Game State Score: %d, Minimax Score: %d, Chosen Action: %s, States Evaluated: %d, Nodes Visited: %d.",
                 state.turn_count, state.score, score, action,
-                self._stats_states_evaluated[-1], self._stats_nodes_visited[-1])
+                self._current_states_evaluated, self._current_nodes_visited)
 
         if (action is None):
             raise ValueError("Did not get an action out of Minimax.")
@@ -103,7 +171,7 @@ class MinimaxLikeAgent(pacai.core.agent.Agent):
         Return: ([best action, ...], best score).
         """
 
-        self._stats_nodes_visited[-1] += 1
+        self._current_nodes_visited += 1
 
         # If we see ourselves, then we have descended a full ply.
         if (state.agent_index == self.agent_index):
@@ -118,22 +186,114 @@ class MinimaxLikeAgent(pacai.core.agent.Agent):
         if (state.game_over):
             return [], self.evaluate_state(state)
 
+        # Check if an identical state (a transposition) has already been resolved this turn.
+        key = (state.agent_index, ply_count, hash(state))
+        entry = self._transposition_table.get(key)
+        if (entry is not None):
+            (cached_actions, cached_score, bound) = entry
+
+            if (bound == _TT_EXACT):
+                return cached_actions, cached_score
+
+            # Bound entries come from pruned searches, use them to tighten the alpha-beta window.
+            if (bound == _TT_LOWER):
+                alpha = max(alpha, cached_score)
+            else:
+                beta = min(beta, cached_score)
+
+            if (alpha >= beta):
+                return cached_actions, cached_score
+
+        # Remember the incoming window so we can classify the result before storing it.
+        (alpha_original, beta_original) = (alpha, beta)
+
         legal_actions = state.get_legal_actions()
 
         # Don't consider stopping unless we can do nothing else.
         # This will help keep the game moving along.
-        if ((len(legal_actions) > 1) and (pacai.core.action.STOP in legal_actions)):
-            legal_actions.remove(pacai.core.action.STOP)
+        # Filter in one pass (identity is safe, legal actions use the interned STOP).
+        if (len(legal_actions) > 1):
+            legal_actions = [action for action in legal_actions if action is not _STOP]
 
         if (state.agent_index == self.agent_index):
             # We are considering ourselves, get the max.
-            return self.minimax_step_max(state, ply_count, legal_actions, alpha, beta)
+            (actions, score) = self.minimax_step_max(state, ply_count, legal_actions, alpha, beta)
+        elif (self.expectimax):
+            # We are considering an opposing agent (like a ghost), get the expected min.
+            (actions, score) = ([], self.minimax_step_expected_min(state, ply_count, legal_actions, alpha, beta))
+        else:
+            # We are considering an opposing agent (like a ghost), get the min.
+            (actions, score) = self.minimax_step_min(state, ply_count, legal_actions, alpha, beta)
+
+        # Store the result, flagging whether a cutoff truncated it into a one-sided bound.
+        if (score <= alpha_original):
+            bound = _TT_UPPER
+        elif (score >= beta_original):
+            bound = _TT_LOWER
+        else:
+            bound = _TT_EXACT
+
+        self._transposition_table[key] = (actions, score, bound)
+
+        # Remember the best action for this state to guide move ordering on deeper passes.
+        if (len(actions) > 0):
+            self._pv_moves[(key[0], key[2])] = actions[0]
+
+        return actions, score
+
+    def _generate_successor(self,
+            state: pacai.core.gamestate.GameState,
+            action: pacai.core.action.Action,
+            ) -> pacai.core.gamestate.GameState:
+        """
+        Generate (or fetch the cached) successor for the given state/action pair.
+        See _successor_cache.
+        """
 
-        # We are considering an opposing agent (like a ghost), get the min or expected min.
-        if (self.expectimax):
-            return [], self.minimax_step_expected_min(state, ply_count, legal_actions, alpha, beta)
+        key = (id(state), action)
+        entry = self._successor_cache.get(key)
+        if (entry is not None):
+            return entry[1]
 
-        return self.minimax_step_min(state, ply_count, legal_actions, alpha, beta)
+        successor = state.generate_successor(action, self.rng)
+        self._successor_cache[key] = (state, successor)
+
+        return successor
+
+    def _ordered_actions(self,
+            state: pacai.core.gamestate.GameState,
+            legal_actions: list[pacai.core.action.Action],
+            maximize: bool,
+            ) -> list[pacai.core.action.Action]:
+        """
+        Order actions by a shallow (1-ply) evaluation of their successors,
+        best first for the given player (descending for max, ascending for min).
+        Alpha-beta pruning is most effective when the best action is searched first,
+        since the first child often produces the cutoff for its siblings.
+
+        The generated successors are not returned,
+        they stay in the per-turn successor cache so the caller's lazy iteration picks them up
+        without holding a second reference here.
+
+        Return: [ordered action, ...].
+        """
+
+        # Bind the hot callables once, the loops below run for every node in the search tree.
+        generate_successor = self._generate_successor
+        evaluate_state = self.evaluate_state
+
+        successors = {action: generate_successor(state, action) for action in legal_actions}
+        scores = {action: evaluate_state(successor) for (action, successor) in successors.items()}
+
+        ordered_actions = sorted(legal_actions, key = scores.__getitem__, reverse = maximize)
+
+        # If an earlier (shallower) pass already found a best action for this state, try it first.
+        pv_action = self._pv_moves.get((state.agent_index, hash(state)))
+        if ((pv_action is not None) and (pv_action in ordered_actions)):
+            ordered_actions.remove(pv_action)
+            ordered_actions.insert(0, pv_action)
+
+        return ordered_actions
 
     def minimax_step_max(self,
             state: pacai.core.gamestate.GameState,
@@ -149,20 +309,40 @@ class MinimaxLikeAgent(pacai.core.agent.Agent):
 
         alpha and beta can be ignored (and just passed along) when not doing alpha-beta pruning.
 
-        The default implementation is just random and does not follow any minimax procedure.
-        Child classes should override this method.
-
         Return: ([best action, ...], best score).
         """
 
-        # Randomly choose an action.
-        action = self.rng.choice(legal_actions)
+        # Move ordering only pays off when it can trigger earlier cutoffs.
+        if (self.alphabeta_prune):
+            legal_actions = self._ordered_actions(state, legal_actions, True)
 
-        # Score the action.
-        successor = state.generate_successor(action, self.rng)
-        _, score = self.minimax_step(successor, ply_count, alpha, beta)
+        best_score = -math.inf
+        best_actions: list[pacai.core.action.Action] = []
+
+        # Bind the hot callables once, this loop runs for every node in the search tree.
+        generate_successor = self._generate_successor
+        minimax_step = self.minimax_step
+        prune = self.alphabeta_prune
 
-        return [action], score
+        # Generate successors lazily, a cutoff means the pruned siblings are never materialized.
+        for action in legal_actions:
+            successor = generate_successor(state, action)
+            _, score = minimax_step(successor, ply_count, alpha, beta)
+
+            if (score > best_score):
+                best_score = score
+                best_actions = [action]
+            elif (score == best_score):
+                best_actions.append(action)
+
+            if (prune):
+                # The min player above us already has a better option, prune the remaining actions.
+                if (best_score >= beta):
+                    return best_actions, best_score
+
+                alpha = max(alpha, best_score)
+
+        return best_actions, best_score
 
     def minimax_step_min(self,
             state: pacai.core.gamestate.GameState,
@@ -178,20 +358,40 @@ class MinimaxLikeAgent(pacai.core.agent.Agent):
 
         alpha and beta can be ignored (and just passed along) when not doing alpha-beta pruning.
 
-        The default implementation is just random and does not follow any minimax procedure.
-        Child classes should override this method.
-
         Return: ([best action, ...], best score).
         """
 
-        # Randomly choose an action.
-        action = self.rng.choice(legal_actions)
+        # Move ordering only pays off when it can trigger earlier cutoffs.
+        if (self.alphabeta_prune):
+            legal_actions = self._ordered_actions(state, legal_actions, False)
 
-        # Score the action.
-        successor = state.generate_successor(action, self.rng)
-        _, score = self.minimax_step(successor, ply_count, alpha, beta)
+        best_score = math.inf
+        best_actions: list[pacai.core.action.Action] = []
+
+        # Bind the hot callables once, this loop runs for every node in the search tree.
+        generate_successor = self._generate_successor
+        minimax_step = self.minimax_step
+        prune = self.alphabeta_prune
 
-        return [action], score
+        # Generate successors lazily, a cutoff means the pruned siblings are never materialized.
+        for action in legal_actions:
+            successor = generate_successor(state, action)
+            _, score = minimax_step(successor, ply_count, alpha, beta)
+
+            if (score < best_score):
+                best_score = score
+                best_actions = [action]
+            elif (score == best_score):
+                best_actions.append(action)
+
+            if (prune):
+                # The max player above us already has a better option, prune the remaining actions.
+                if (best_score <= alpha):
+                    return best_actions, best_score
+
+                beta = min(beta, best_score)
+
+        return best_actions, best_score
 
     def minimax_step_expected_min(self,
             state: pacai.core.gamestate.GameState,
@@ -208,17 +408,21 @@ class MinimaxLikeAgent(pacai.core.agent.Agent):
         Note that unlike minimax_step_max() and minimax_step_min(),
         no action is returned.
 
-        alpha and beta can be ignored (and just passed along) when not doing alpha-beta pruning.
-
-        The default implementation is just random and does not follow any minimax procedure.
-        Child classes should override this method.
+        The expectation is taken over all legal actions,
+        with the standard expectimax assumption that the adversary chooses uniformly at random.
+        alpha and beta are ignored,
+        since an exact expectation cannot be pruned with standard alpha-beta bounds.
         """
 
-        # Randomly choose an action.
-        action = self.rng.choice(legal_actions)
+        # Bind the hot callables once, this loop runs for every node in the search tree.
+        generate_successor = self._generate_successor
+        minimax_step = self.minimax_step
 
-        # Score the action.
-        successor = state.generate_successor(action, self.rng)
-        _, score = self.minimax_step(successor, ply_count, alpha, beta)
+        # Children are searched with a full window, see above.
+        total = 0.0
+        for action in legal_actions:
+            successor = generate_successor(state, action)
+            _, score = minimax_step(successor, ply_count, -math.inf, math.inf)
+            total += score
 
-        return score
+        return total / len(legal_actions)
@@ -5,6 +5,8 @@ import pacai.core.gamestate
 class RandomAgent(pacai.core.agent.Agent):
     """ An agent that just takes random (legal) action. """
 
+    __slots__ = ()
+
     def get_action(self, state: pacai.core.gamestate.GameState) -> pacai.core.action.Action:
         """ Choose a random action. """
 
@@ -1,3 +1,5 @@
+import collections
+import itertools
 import logging
 import typing
 
@@ -14,6 +16,7 @@ import pacai.search.common
 import pacai.search.random
 import pacai.search.position
 import pacai.util.alias
+import pacai.util.comparable
 import pacai.util.reflection
 
 DEFAULT_PROBLEM: str = pacai.util.alias.SEARCH_PROBLEM_POSITION.long
@@ -27,6 +30,8 @@ class SearchProblemAgent(pacai.core.agent.Agent):
     and then executing the path found during the search.
     """
 
+    __slots__ = ('_problem_class', '_problem_cost_function', '_solver_function', '_heuristic_function', '_actions')
+
     def __init__(self,
             problem: type[pacai.core.search.SearchProblem] | pacai.util.reflection.Reference | str = DEFAULT_PROBLEM,
             problem_cost: pacai.core.search.CostFunction | pacai.util.reflection.Reference | str = DEFAULT_PROBLEM_COST,
@@ -51,20 +56,22 @@ class SearchProblemAgent(pacai.core.agent.Agent):
         self._heuristic_function: pacai.core.search.SearchHeuristic = claen_heuristic_function
         """ The search heuristic function this agent will use. """
 
-        self._actions: list[pacai.core.action.Action] = []
+        self._actions: collections.deque[pacai.core.action.Action] = collections.deque()
         """ The actions that the search solver came up with. """
 
-        logging.debug("Created a SearchProblemAgent using problem '%s', cost function '%s', solver '%s', and heuristic '%s'.",
-                pacai.util.reflection.get_qualified_name(problem),
-                pacai.util.reflection.get_qualified_name(problem_cost),
-                pacai.util.reflection.get_qualified_name(solver),
-                pacai.util.reflection.get_qualified_name(heuristic))
+        # Only pay for the qualified name lookups when debug logging is actually on.
+        if (logging.getLogger().getEffectiveLevel() <= logging.DEBUG):
+            logging.debug("Created a SearchProblemAgent using problem '%s', cost function '%s', solver '%s', and heuristic '%s'.",
+                    pacai.util.reflection.get_qualified_name(problem),
+                    pacai.util.reflection.get_qualified_name(problem_cost),
+                    pacai.util.reflection.get_qualified_name(solver),
+                    pacai.util.reflection.get_qualified_name(heuristic))
 
     def get_action(self, state: pacai.core.gamestate.GameState) -> pacai.core.action.Action:
         if (len(self._actions) == 0):
             return pacai.core.action.STOP
 
-        return self._actions.pop(0)
+        return self._actions.popleft()
 
     def game_start_full(self,
             agent_index: int,
@@ -81,18 +88,18 @@ class SearchProblemAgent(pacai.core.agent.Agent):
         (solution, position_history, expanded_node_count) = self._do_search(initial_state)
         end_time = edq.util.time.Timestamp.now()
 
-        self._actions = solution.actions
+        self._actions = collections.deque(solution.actions)
 
         logging.info("Path found with %d steps and a total cost of %0.2f in %0.2f seconds. %d search nodes expanded.",
                 len(solution.actions), solution.cost, (end_time.sub(start_time).to_secs()), expanded_node_count)
 
-        # Highlight visited locations in the UI to visually represent our search pattern.
+        # Highlight visited locations in the UI to visually represent our search pattern,
+        # gradually increasing the highlight intensity from the start to the end.
         highlights = []
-        for (i, position) in enumerate(position_history):
-            # Gradually increase the highlight intensity from the start to the end.
-            intensity = (i + 1) / len(position_history)
-
-            highlights.append(pacai.core.board.Highlight(position, intensity))
+        if (len(position_history) > 0):
+            inverse_count = 1.0 / len(position_history)
+            highlights = [pacai.core.board.Highlight(position, (i + 1) * inverse_count)
+                    for (i, position) in enumerate(position_history)]
 
         return pacai.core.agentaction.AgentAction(board_highlights = highlights)
 
@@ -105,14 +112,50 @@ class SearchProblemAgent(pacai.core.agent.Agent):
         Return: (solution, position history, expanded node count).
         """
 
-        search_problem = self._problem_class(game_state = state, cost_function = self._problem_cost_function)
-        solution = self._solver_function(search_problem, self._heuristic_function, self.rng)
+        # Hoist the attribute lookups into locals (this runs once per subproblem in greedy chains).
+        problem_class = self._problem_class
+        cost_function = self._problem_cost_function
+        solver_function = self._solver_function
+
+        search_problem = problem_class(game_state = state, cost_function = cost_function)
+        solution = solver_function(search_problem, self._make_cached_heuristic(), self.rng)
 
         if (solution.goal_node is not None):
             search_problem.complete(solution.goal_node)
 
         return (solution, search_problem.position_history, search_problem.expanded_node_count)
 
+    def _make_cached_heuristic(self) -> pacai.core.search.SearchHeuristic:
+        """
+        Wrap this agent's heuristic function with a per-search memo keyed by search node.
+        Heuristics are pure functions of the node (for a fixed problem),
+        and searches reach the same node along many different paths,
+        so repeated evaluations are answered from the memo.
+        The memo only lives for one search, which keeps it from ever spanning two problems.
+
+        Nodes that fall back to SimpleComparable's hash pay a JSON serialization per dict probe
+        (more than most heuristics cost), so only nodes with their own cheap hash are memoized.
+        """
+
+        heuristic_function = self._heuristic_function
+        slow_hash = pacai.util.comparable.SimpleComparable.__hash__
+        memo: dict[pacai.core.search.SearchNode, float] = {}
+
+        def cached_heuristic(node: pacai.core.search.SearchNode,
+                problem: pacai.core.search.SearchProblem,
+                **kwargs: typing.Any) -> float:
+            if (type(node).__hash__ is slow_hash):
+                return heuristic_function(node, problem, **kwargs)
+
+            value = memo.get(node)
+            if (value is None):
+                value = heuristic_function(node, problem, **kwargs)
+                memo[node] = value
+
+            return value
+
+        return cached_heuristic
+
 class GreedySubproblemSearchAgent(SearchProblemAgent):
     """
     An agent that greedily solves several search problems (instead of just one main one).
@@ -121,32 +164,56 @@ class GreedySubproblemSearchAgent(SearchProblemAgent):
     Once the goal is reached, the actions from all subproblem solutions will be concatenated to form the final list of actions.
     """
 
+    __slots__ = ('_subproblem_cache',)
+
+    def __init__(self, **kwargs: typing.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._subproblem_cache: dict[typing.Any, tuple[pacai.core.search.SearchSolution, list[pacai.core.board.Position], int]] = {}
+        """
+        Cache of solved subproblems keyed by an exact state signature
+        (active agent, score, and board contents).
+        If an identical state recurs (e.g., a cycle in the subproblem chain),
+        the previous solution is reused instead of invoking the solver again.
+        """
+
     def _do_search(self,
             state: pacai.core.gamestate.GameState,
             ) -> tuple[pacai.core.search.SearchSolution, list[pacai.core.board.Position], int]:
-        actions = []
+        # Buffer the per-subproblem lists and concatenate once at the end,
+        # instead of paying a copy per subproblem with +=.
+        action_chunks = []
+        history_chunks = []
         total_cost = 0.0
         goal_node = None
-        total_position_history = []
         total_expanded_node_count = 0
 
         while (not state.game_over):
-            # Solve the subproblem.
-            (solution, position_history, expanded_node_count) = super()._do_search(state)
+            # Solve the subproblem (reusing the previous solution if this exact state was already solved).
+            # The key carries full equality (not just a hash), so collisions cannot alias distinct states.
+            state_key = (state.agent_index, state.score, state.board.state_key())
+            cached_result = self._subproblem_cache.get(state_key)
+            if (cached_result is not None):
+                (solution, position_history, expanded_node_count) = cached_result
+            else:
+                (solution, position_history, expanded_node_count) = super()._do_search(state)
+                self._subproblem_cache[state_key] = (solution, position_history, expanded_node_count)
 
             if (solution.goal_node is None):
                 raise ValueError("Failed to solve subproblem.")
 
             # Add all the components of the sub-solution to the total solution.
-            actions += solution.actions
+            action_chunks.append(solution.actions)
             total_cost += solution.cost
             goal_node = solution.goal_node
-            total_position_history += position_history
+            history_chunks.append(position_history)
             total_expanded_node_count += expanded_node_count
 
-            # Move to the next state by applying all the actions.
-            for action in solution.actions:
-                state = state.generate_successor(action, self.rng)
+            # Move to the next state by applying all the actions against a single copy.
+            state = state.generate_successor_sequence(solution.actions, self.rng)
+
+        actions = list(itertools.chain.from_iterable(action_chunks))
+        total_position_history = list(itertools.chain.from_iterable(history_chunks))
 
         solution = pacai.core.search.SearchSolution(actions, total_cost, goal_node)
         return (solution, total_position_history, total_expanded_node_count)
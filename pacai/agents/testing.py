@@ -5,6 +5,29 @@ import pacai.agents.dummy
 import pacai.core.action
 import pacai.core.gamestate
 
+_BUSY_WAIT_MAX_SECS: float = 0.001
+""" Waits at or below this duration are busy-waited instead of slept (sleeping oversleeps them). """
+
+def _wait(secs: float) -> None:
+    """
+    Wait for the given duration.
+    Zero (or negative) waits return immediately without a syscall,
+    and very small waits spin on the monotonic clock
+    since time.sleep() can overshoot short durations by several milliseconds.
+    """
+
+    if (secs <= 0.0):
+        return
+
+    if (secs <= _BUSY_WAIT_MAX_SECS):
+        deadline = time.perf_counter() + secs
+        while (time.perf_counter() < deadline):
+            pass
+
+        return
+
+    time.sleep(secs)
+
 class TimeoutAgent(pacai.agents.dummy.DummyAgent):
     """
     A testing agent that will wait a specific amount of time before completing specific tasks
@@ -14,6 +37,8 @@ class TimeoutAgent(pacai.agents.dummy.DummyAgent):
     All wait times are in floating seconds.
     """
 
+    __slots__ = ('_game_start_wait', '_game_complete_wait', '_get_action_wait')
+
     def __init__(self,
             game_start_wait: float = 0.0,
             game_complete_wait: float = 0.0,
@@ -21,23 +46,33 @@ class TimeoutAgent(pacai.agents.dummy.DummyAgent):
             **kwargs: typing.Any) -> None:
         super().__init__(**kwargs)
 
-        self._game_start_wait: float = float(game_start_wait)
+        # Agent arguments may come in as strings, only cast when needed.
+        if (not isinstance(game_start_wait, float)):
+            game_start_wait = float(game_start_wait)
+
+        if (not isinstance(game_complete_wait, float)):
+            game_complete_wait = float(game_complete_wait)
+
+        if (not isinstance(get_action_wait, float)):
+            get_action_wait = float(get_action_wait)
+
+        self._game_start_wait: float = game_start_wait
         """ The amount of time to wait before acknowledging the start of the game. """
 
-        self._game_complete_wait: float = float(game_complete_wait)
+        self._game_complete_wait: float = game_complete_wait
         """ The amount of time to wait before acknowledging the completion of the game. """
 
-        self._get_action_wait: float = float(get_action_wait)
+        self._get_action_wait: float = get_action_wait
         """ The amount of time to wait before returning an action. """
 
     def game_start(self, initial_state: pacai.core.gamestate.GameState) -> None:
-        time.sleep(self._game_start_wait)
+        _wait(self._game_start_wait)
         super().game_start(initial_state)
 
     def game_complete(self, final_state: pacai.core.gamestate.GameState) -> None:
-        time.sleep(self._game_complete_wait)
+        _wait(self._game_complete_wait)
         super().game_complete(final_state)
 
     def get_action(self, state: pacai.core.gamestate.GameState) -> pacai.core.action.Action:
-        time.sleep(self._get_action_wait)
+        _wait(self._get_action_wait)
         return super().get_action(state)
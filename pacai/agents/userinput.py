@@ -10,6 +10,8 @@ class UserInputAgent(pacai.core.agent.Agent):
     An agent that makes moves based on input from a user.
     """
 
+    __slots__ = ('_remember_last_action',)
+
     def __init__(self,
             remember_last_action: bool = True,
             **kwargs: typing.Any) -> None:
@@ -26,6 +28,9 @@ class UserInputAgent(pacai.core.agent.Agent):
             ) -> pacai.core.agentaction.AgentAction:
         legal_actions = state.get_legal_actions()
 
+        # Membership is checked up to three times below, use a set for constant-time checks.
+        legal_set = frozenset(legal_actions)
+
         # Specifically note if we used an input from the user.
         # If we did, then we can clear the input buffer.
         # This allows users to input actions without needing to be frame perfect,
@@ -39,7 +44,7 @@ class UserInputAgent(pacai.core.agent.Agent):
             used_user_input = True
 
             # If the intended action is not legal, then ignore it.
-            if (intended_action not in legal_actions):
+            if (intended_action not in legal_set):
                 intended_action = None
                 used_user_input = False
 
@@ -49,8 +54,8 @@ class UserInputAgent(pacai.core.agent.Agent):
             used_user_input = False
 
         # If the action is illegal, then just stop (if legal) or pick a random action.
-        if (intended_action not in legal_actions):
-            if (pacai.core.action.STOP in legal_actions):
+        if (intended_action not in legal_set):
+            if (pacai.core.action.STOP in legal_set):
                 intended_action = pacai.core.action.STOP
             else:
                 intended_action = self.rng.choice(legal_actions)
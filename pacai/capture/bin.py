@@ -3,6 +3,7 @@ The main executable for running a game of Capture.
 """
 
 import argparse
+import functools
 import logging
 import typing
 
@@ -15,6 +16,9 @@ import pacai.util.bin
 DEFAULT_BOARD: str = 'capture-medium'
 DEFAULT_SPRITE_SHEET: str = 'capture'
 
+_RECORD_NAMES: tuple[str, str, str] = ('red', 'tie', 'blue')
+""" Win record names indexed by sign of the score plus one (negative scores are red wins). """
+
 def set_cli_args(parser: argparse.ArgumentParser, **kwargs: typing.Any) -> argparse.ArgumentParser:
     """
     Set Capture-specific CLI arguments.
@@ -38,6 +42,19 @@ def set_cli_args(parser: argparse.ArgumentParser, **kwargs: typing.Any) -> argpa
 
     return parser
 
+@functools.lru_cache(maxsize = 32)
+def _resolve_team(team_func_ref: str) -> pacai.capture.team.TeamCreationFunction:
+    """
+    Resolve a team creation function reference.
+    Batched runs resolve the same references for every game,
+    so the resolved functions are cached by their reference string.
+    Note that only the functions are cached,
+    the team info lists they create are consumed by init_from_args() and must stay per-call.
+    """
+
+    return typing.cast(pacai.capture.team.TeamCreationFunction,
+            pacai.util.reflection.resolve_and_fetch(pacai.capture.team.TeamCreationFunction, team_func_ref))
+
 def init_from_args(args: argparse.Namespace) -> tuple[dict[int, pacai.core.agentinfo.AgentInfo], list[int], dict[str, typing.Any]]:
     """
     Setup agents based on Capture rules.
@@ -47,24 +64,26 @@ def init_from_args(args: argparse.Namespace) -> tuple[dict[int, pacai.core.agent
     Extra agents will be ignored, and missing agents will be filled in with random agents.
     """
 
-    red_team_func = pacai.util.reflection.resolve_and_fetch(pacai.capture.team.TeamCreationFunction, args.red_team_func)
-    blue_team_func = pacai.util.reflection.resolve_and_fetch(pacai.capture.team.TeamCreationFunction, args.blue_team_func)
+    red_team_func = _resolve_team(args.red_team_func)
+    blue_team_func = _resolve_team(args.blue_team_func)
 
     red_team_base = red_team_func()
     blue_team_base = blue_team_func()
 
+    # The board (not parsed yet) dictates how many agents are actually used,
+    # so fill every slot, but only construct the random fallback for slots the rosters don't cover.
+    random_agent_name = pacai.util.alias.AGENT_RANDOM.long
+
     base_agent_infos: dict[int, pacai.core.agentinfo.AgentInfo] = {}
     for i in range(pacai.core.board.MAX_AGENTS):
-        agent_info = pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_RANDOM.long)
-
         team_base = red_team_base
         if (i % 2 == 1):
             team_base = blue_team_base
 
         if (len(team_base) > 0):
-            agent_info = team_base.pop(0)
-
-        base_agent_infos[i] = agent_info
+            base_agent_infos[i] = team_base.pop(0)
+        else:
+            base_agent_infos[i] = pacai.core.agentinfo.AgentInfo(name = random_agent_name)
 
     # Check for random boards.
     args.board = pacai.capture.game.Game.check_for_random_board(args.board)
@@ -83,25 +102,39 @@ def log_capture_results(results: list[pacai.core.game.GameResult], winning_agent
     Log the result of running several games.
     """
 
-    scores = [result.score for result in results]
-    turn_counts = [len(result.history) for result in results]
-
-    record = [('red' if (score < 0.0) else 'blue' if (score > 0.0) else 'tie') for score in scores]
-
     # Avoid logging long lists (which can be a bit slow in Python's logging module).
     log_lists_to_info = (len(results) < pacai.util.bin.SCORE_LIST_MAX_INFO_LENGTH)
     log_lists_to_debug = (logging.getLogger().getEffectiveLevel() <= logging.DEBUG)
+    log_lists = (log_lists_to_info or log_lists_to_debug)
+
+    # Pull everything needed from each result in a single pass.
+    # When the per-game lists will not be logged, only the running sums are kept.
+    score_sum = 0.0
+    turn_count_sum = 0
+    scores = []
+    turn_counts = []
+    record = []
+
+    for result in results:
+        score = result.score
+        score_sum += score
+        turn_count_sum += len(result.history)
+
+        if (log_lists):
+            scores.append(score)
+            turn_counts.append(len(result.history))
+            record.append(_RECORD_NAMES[1 + (score > 0.0) - (score < 0.0)])
 
     joined_scores = ''
     joined_record = ''
     joined_turn_counts = ''
 
-    if (log_lists_to_info or log_lists_to_debug):
-        joined_scores = ', '.join([str(score) for score in scores])
+    if (log_lists):
+        joined_scores = ', '.join(str(score) for score in scores)
         joined_record = ', '.join(record)
-        joined_turn_counts = ', '.join([str(turn_count) for turn_count in turn_counts])
+        joined_turn_counts = ', '.join(str(turn_count) for turn_count in turn_counts)
 
-    logging.info('%sAverage Score: %s', prefix, sum(scores) / float(len(results)))
+    logging.info('%sAverage Score: %s', prefix, score_sum / float(len(results)))
 
     if (log_lists_to_info):
         logging.info('%sScores:        %s', prefix, joined_scores)
@@ -113,7 +146,7 @@ def log_capture_results(results: list[pacai.core.game.GameResult], winning_agent
     elif (log_lists_to_debug):
         logging.debug('%sRecord:        %s', prefix, joined_record)
 
-    logging.info('%sAverage Turns: %s', prefix, sum(turn_counts) / float(len(results)))
+    logging.info('%sAverage Turns: %s', prefix, turn_count_sum / float(len(results)))
 
     if (log_lists_to_info):
         logging.info('%sTurn Counts:   %s', prefix, joined_turn_counts)
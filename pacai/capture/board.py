@@ -1,4 +1,5 @@
 import argparse
+import functools
 import logging
 import random
 import sys
@@ -32,6 +33,18 @@ MAX_CAPSULES: int = 4
 
 DEFAULT_NUM_AGENTS: int = 2
 
+_RANDOM_SIZES: tuple[int, ...] = tuple(range(MIN_SIZE, MAX_RANDOM_SIZE + 1, 2))
+""" The allowed sizes for a maze with unspecified size. """
+
+_EMPTY_BYTE: int = ord(pacai.core.board.MARKER_EMPTY)
+""" The empty marker as a grid byte. """
+
+_WALL_BYTE: int = ord(pacai.core.board.MARKER_WALL)
+""" The wall marker as a grid byte. """
+
+_EMPTY_FLAG_TABLE: bytes = bytes((1 if (value == _EMPTY_BYTE) else 0) for value in range(256))
+""" Translation table mapping the empty marker byte to 1 and everything else to 0. """
+
 class Maze:
     """
     A recursive definition of a maze.
@@ -71,14 +84,21 @@ class Maze:
         """
 
         if (grid is None):
-            grid = [[pacai.core.board.MARKER_EMPTY for col in range(width)] for row in range(height)]
+            grid = bytearray(pacai.core.board.MARKER_EMPTY.encode() * (height * width))
 
-        self.grid: list[list[pacai.core.board.Marker]] = grid
+        self.grid: bytearray = grid
         """
-        A 2-dimensional representation of all the markers in this maze.
-        All mazes in this tree will share the same grid.
+        A flat (row-major) representation of all the markers in this maze,
+        stored as single marker bytes so cell reads/writes are one index into a contiguous buffer.
+        All mazes in this tree will share the same grid (sized by the root maze).
         """
 
+        self._grid_height: int = root.height
+        """ The height of the (root) grid. """
+
+        self._grid_width: int = root.width
+        """ The width (row stride) of the (root) grid. """
+
         if (len(self.grid) == 0):
             raise ValueError("Grid cannot have a zero height.")
 
@@ -95,7 +115,7 @@ class Maze:
     def place_relative(self, row: int, col: int, marker: pacai.core.board.Marker) -> None:
         """ Place a marker in the grid according to the relative coordinates of this submaze. """
 
-        self.grid[self.anchor.row + row][self.anchor.col + col] = marker
+        self.grid[((self.anchor.row + row) * self._grid_width) + (self.anchor.col + col)] = ord(marker)
 
     def is_marker_relative(self, row: int, col: int, marker: pacai.core.board.Marker) -> bool:
         """ Check if the given marker exists at the relative coordinates of this submaze. """
@@ -104,10 +124,10 @@ class Maze:
         true_col = self.anchor.col + col
 
         # No markers are out-of-bounds.
-        if ((true_row < 0) or (true_row >= len(self.grid)) or (true_col < 0) or (true_col >= len(self.grid[0]))):
+        if ((true_row < 0) or (true_row >= self._grid_height) or (true_col < 0) or (true_col >= self._grid_width)):
             return False
 
-        return (self.grid[true_row][true_col] == marker)
+        return (self.grid[(true_row * self._grid_width) + true_col] == ord(marker))
 
     def to_board(self, source: str) -> pacai.core.board.Board:
         """
@@ -117,33 +137,42 @@ class Maze:
 
         # Make a new grid that is big enough to include the opposing side (mirrored) and a border (wall) around the entire board.
         # Initialize with wall markers for the boarder.
-        new_grid = [[pacai.core.board.MARKER_WALL for col in range((self.width * 2) + 2)] for row in range(self.height + 2)]
+        # Newlines are kept inline in the buffer, so the final text is a single decode (no per-row joins).
+        new_width = (self.width * 2) + 2
+        line_width = new_width + 1
+        new_grid = bytearray(_wall_template(self.height + 2, new_width))
 
-        for base_row in range(self.height):
-            for base_col in range(self.width):
-                # Offset for the boarder.
-                row = base_row + 1
-                col = base_col + 1
+        zero_byte = ord(pacai.core.board.MARKER_AGENT_0)
+        nine_byte = ord(pacai.core.board.MARKER_AGENT_9)
 
-                # Copy the left side, and mirror around both axes for the right side.
+        # Copy each source row into the left side and its reversed mirror row into the right side
+        # as two contiguous slice assignments (instead of scattered per-cell writes).
+        for base_row in range(self.height):
+            copy_base = base_row * self.width
+            mirror_base = (self.height - base_row - 1) * self.width
+            new_base = (base_row + 1) * line_width
 
-                copy_marker = self.grid[base_row][base_col]
-                mirror_marker = self.grid[self.height - base_row - 1][self.width - base_col - 1]
+            copy_row = self.grid[copy_base:copy_base + self.width]
+            mirror_row = self.grid[mirror_base:mirror_base + self.width]
+            mirror_row.reverse()
 
-                # If either marker is an agent, adjust the indexes.
-                # Even (including 0) are on the left, and odds are on the right.
+            # If any marker is an agent (a digit), adjust the indexes.
+            # Even (including 0) are on the left, and odds are on the right.
 
-                if (copy_marker.is_agent()):
-                    copy_marker = pacai.core.board.Marker(str(copy_marker.get_agent_index() * 2))
+            for (base_col, marker) in enumerate(copy_row):
+                if (zero_byte <= marker <= nine_byte):
+                    copy_row[base_col] = ((marker - zero_byte) * 2) + zero_byte
 
-                if (mirror_marker.is_agent()):
-                    mirror_marker = pacai.core.board.Marker(str((mirror_marker.get_agent_index() * 2) + 1))
+            for (base_col, marker) in enumerate(mirror_row):
+                if (zero_byte <= marker <= nine_byte):
+                    mirror_row[base_col] = ((marker - zero_byte) * 2) + 1 + zero_byte
 
-                # Place the final markers.
-                new_grid[row][col] = copy_marker
-                new_grid[row][col + self.width] = mirror_marker
+            # Place the final rows (offset by one for the boarder).
+            new_grid[new_base + 1:new_base + 1 + self.width] = copy_row
+            new_grid[new_base + 1 + self.width:new_base + 1 + (2 * self.width)] = mirror_row
 
-        board_text = "\n".join([''.join(row) for row in new_grid])
+        # Drop the trailing newline so the text matches a plain join of rows.
+        board_text = new_grid[:-1].decode()
 
         kwargs = {
             'strip': False,
@@ -152,110 +181,103 @@ class Maze:
 
         return pacai.core.board.load_string(source, board_text, **kwargs)
 
-    def _add_wall(self, rng: random.Random, wall_index: int, gaps: float = 1.0, vertical: bool = True) -> bool:
-        """
-        Try to add a vertical wall with gaps at the given location.
-        Return True if a wall was added, False otherwise.
-        """
+    def _is_empty_cell(self, row: int, col: int) -> bool:
+        """ Check if the given absolute grid coordinates hold an empty marker (out-of-bounds is not empty). """
 
-        if (vertical):
-            return self._add_vertical_wall(rng, wall_index, gaps = gaps)
+        if ((row < 0) or (row >= self._grid_height) or (col < 0) or (col >= self._grid_width)):
+            return False
 
-        return self._add_horizontal_wall(rng, wall_index, gaps = gaps)
+        return (self.grid[(row * self._grid_width) + col] == _EMPTY_BYTE)
 
-    def _add_vertical_wall(self, rng: random.Random, col: int, gaps: float = 1.0) -> bool:
+    def _add_vertical_wall(self, rng: random.Random,
+            anchor_row: int, anchor_col: int, height: int, width: int,
+            col: int, gaps: float = 1.0,
+            ) -> list[tuple[int, int, int, int]]:
         """
-        Try to add a vertical wall with gaps at the given col.
-        Return True if a wall was added, False otherwise.
+        Try to add a vertical wall with gaps at the given col of the given region.
+        Return the two regions (anchor row, anchor col, height, width) the wall created,
+        or an empty list if no wall was added.
         """
 
         # Choose the specific number of gaps we are expecting.
-        gaps = int(round(min(self.height, gaps)))
+        discrete_gaps = int(round(min(height, gaps)))
 
         # The places (rows) that we may put a wall.
-        slots = list(range(self.height))
+        slots = list(range(height))
 
         # If there are empty spaces directly above or below our proposed wall,
         # then don't put a wall marker directly in front of those respective spaces.
         # This prevents us blocking entrances into our submaze.
 
-        if (self.is_marker_relative(-1, col, pacai.core.board.MARKER_EMPTY)):
+        if (self._is_empty_cell(anchor_row - 1, anchor_col + col)):
             slots.remove(0)
 
         if (len(slots) == 0):
-            return False
+            return []
 
-        if (self.is_marker_relative(self.height, col, pacai.core.board.MARKER_EMPTY)):
-            slots.remove(self.height - 1)
+        if (self._is_empty_cell(anchor_row + height, anchor_col + col)):
+            slots.remove(height - 1)
 
         # If we cannot provided the requested number of gaps, then don't put down the wall.
-        if (len(slots) <= gaps):
-            return False
-
-        # Randomize where we will put our walls.
-        rng.shuffle(slots)
-
-        # Skip the first slots (these are gaps), and place the rest.
-        for row in slots[gaps:]:
-            self.place_relative(row, col, pacai.core.board.MARKER_WALL)
-
-        # By placing a wall, we have created two new submazes (on each side of the wall).
-
-        # One submaze to the left.
-        self.submazes.append(Maze(self.height, col, anchor = self.anchor, root = self.root))
-
-        # One submaze to the right.
-        anchor_offset = pacai.core.board.Position(0, col + 1)
-        self.submazes.append(Maze(self.height, (self.width - col - 1), self.anchor.add(anchor_offset), self.root))
-
-        return True
-
-    def _add_horizontal_wall(self, rng: random.Random, row: int, gaps: float = 1.0) -> bool:
+        if (len(slots) <= discrete_gaps):
+            return []
+
+        # Sample just the wall positions (the remaining slots are the gaps),
+        # instead of shuffling the full slot list and discarding a prefix.
+        stride = self._grid_width
+        for row in rng.sample(slots, len(slots) - discrete_gaps):
+            self.grid[((anchor_row + row) * stride) + (anchor_col + col)] = _WALL_BYTE
+
+        # By placing a wall, we have created two new regions (on each side of the wall).
+        return [
+            (anchor_row, anchor_col, height, col),
+            (anchor_row, anchor_col + col + 1, height, width - col - 1),
+        ]
+
+    def _add_horizontal_wall(self, rng: random.Random,
+            anchor_row: int, anchor_col: int, height: int, width: int,
+            row: int, gaps: float = 1.0,
+            ) -> list[tuple[int, int, int, int]]:
         """
-        Try to add a horizontal wall with gaps at the given row.
-        Return True if a wall was added, False otherwise.
+        Try to add a horizontal wall with gaps at the given row of the given region.
+        Return the two regions (anchor row, anchor col, height, width) the wall created,
+        or an empty list if no wall was added.
         """
 
         # Choose the specific number of gaps we are expecting.
-        discrete_gaps = int(round(min(self.width, gaps)))
+        discrete_gaps = int(round(min(width, gaps)))
 
         # The places (cols) that we may put a wall.
-        slots = list(range(self.width))
+        slots = list(range(width))
 
         # If there are empty spaces directly to the left/right of our proposed wall,
         # then don't put a wall marker directly in front of those respective spaces.
         # This prevents us blocking entrances into our submaze.
 
-        if (self.is_marker_relative(row, -1, pacai.core.board.MARKER_EMPTY)):
+        if (self._is_empty_cell(anchor_row + row, anchor_col - 1)):
             slots.remove(0)
 
         if (len(slots) == 0):
-            return False
+            return []
 
-        if (self.is_marker_relative(row, self.width, pacai.core.board.MARKER_EMPTY)):
-            slots.remove(self.width - 1)
+        if (self._is_empty_cell(anchor_row + row, anchor_col + width)):
+            slots.remove(width - 1)
 
         # If we cannot provided the requested number of gaps, then don't put down the wall.
         if (len(slots) <= discrete_gaps):
-            return False
+            return []
 
-        # Randomize where we will put our walls.
-        rng.shuffle(slots)
+        # Sample just the wall positions (the remaining slots are the gaps),
+        # instead of shuffling the full slot list and discarding a prefix.
+        stride = self._grid_width
+        for col in rng.sample(slots, len(slots) - discrete_gaps):
+            self.grid[((anchor_row + row) * stride) + (anchor_col + col)] = _WALL_BYTE
 
-        # Skip the first slots (these are gaps), and place the rest.
-        for col in slots[discrete_gaps:]:
-            self.place_relative(row, col, pacai.core.board.MARKER_WALL)
-
-        # By placing a wall, we have created two new submazes (on each side of the wall).
-
-        # One submaze above.
-        self.submazes.append(Maze(row, self.width, anchor = self.anchor, root = self.root))
-
-        # One submaze below.
-        anchor_offset = pacai.core.board.Position(row + 1, 0)
-        self.submazes.append(Maze((self.height - row - 1), self.width, self.anchor.add(anchor_offset), self.root))
-
-        return True
+        # By placing a wall, we have created two new regions (on each side of the wall).
+        return [
+            (anchor_row, anchor_col, row, width),
+            (anchor_row + row + 1, anchor_col, height - row - 1, width),
+        ]
 
     def build(self,
             rng: random.Random,
@@ -275,24 +297,29 @@ class Maze:
 
         self.prison_width = rng.randint(0, MAX_PRISON_WIDTH)
 
+        grid = self.grid
+        stride = self._grid_width
+        anchor_row = self.anchor.row
+        anchor_col = self.anchor.col
+
         for prison_col in range(self.prison_width):
             # Compute the actual column the wall for this prison column is on.
             wall_col = (2 * (prison_col + 1)) - 1
 
             # Mark a full vertical of walls.
             for row in range(self.height):
-                self.place_relative(row, wall_col, pacai.core.board.MARKER_WALL)
+                grid[((anchor_row + row) * stride) + anchor_col + wall_col] = _WALL_BYTE
 
             # Make an opening at either the top or bottom.
             if (prison_col % 2 == 0):
-                self.place_relative(0, wall_col, pacai.core.board.MARKER_EMPTY)
+                grid[(anchor_row * stride) + anchor_col + wall_col] = _EMPTY_BYTE
             else:
-                self.place_relative(self.height - 1, wall_col, pacai.core.board.MARKER_EMPTY)
+                grid[((anchor_row + self.height - 1) * stride) + anchor_col + wall_col] = _EMPTY_BYTE
 
         # Everything outside the prison is now a submaze.
         # We will not make a submaze for the prison, since we don't want to edit that.
-        anchor_offset = pacai.core.board.Position(0, 2 * self.prison_width)
-        non_prison_submaze = Maze(self.height, self.width - (2 * self.prison_width), self.anchor.add(anchor_offset), self.root)
+        anchor = pacai.core.board.Position(anchor_row, anchor_col + (2 * self.prison_width))
+        non_prison_submaze = Maze(self.height, self.width - (2 * self.prison_width), anchor, self.root)
         self.submazes.append(non_prison_submaze)
 
         # Build the rest of the maze.
@@ -310,47 +337,59 @@ class Maze:
             gaps: float = DEFAULT_GAPS, gap_factor: float = DEFAULT_GAP_FACTOR,
             vertical: bool = True) -> None:
         """
-        Recursively build a maze by making a wall (which will create 0 or two submazes),
-        and then building a maze with a different orientation in the submaze.
+        Build a maze by making a wall (which will create 0 or two subregions),
+        and then building a maze with a different orientation in each subregion.
+
+        The regions are tracked as plain (anchor row, anchor col, height, width) tuples
+        on an explicit stack (walked in the same depth-first order the old recursion used),
+        so building allocates no per-region Maze objects and cannot hit the recursion limit.
         """
 
-        # Stop when there is no more room in either orientation.
-        if ((self.height <= MIN_MAZE_AXIS_WIDTH) and (self.width <= MIN_MAZE_AXIS_WIDTH)):
-            return
+        stack = [(self.anchor.row, self.anchor.col, self.height, self.width, gaps, vertical)]
 
-        # Decide between vertical and horizontal walls by seeing how much space is left across the primary axis
-        # (width if vertical, height if horizontal).
-        if (vertical):
-            axis_width = self.width
-        else:
-            axis_width = self.height
+        while (len(stack) > 0):
+            (anchor_row, anchor_col, height, width, gaps, vertical) = stack.pop()
+
+            # Stop when there is no more room in either orientation.
+            if ((height <= MIN_MAZE_AXIS_WIDTH) and (width <= MIN_MAZE_AXIS_WIDTH)):
+                continue
 
-        # If there is not enough room on this axis, flip the orientation.
-        if (axis_width < (MIN_MAZE_AXIS_WIDTH + 2)):
-            vertical = not vertical
-            if vertical:
-                axis_width = self.width
+            # Decide between vertical and horizontal walls by seeing how much space is left across the primary axis
+            # (width if vertical, height if horizontal).
+            if (vertical):
+                axis_width = width
             else:
-                axis_width = self.height
+                axis_width = height
 
-        # Add a wall to the current maze
-        wall_slots = range(1, axis_width - 1)
+            # If there is not enough room on this axis, flip the orientation.
+            if (axis_width < (MIN_MAZE_AXIS_WIDTH + 2)):
+                vertical = not vertical
+                if vertical:
+                    axis_width = width
+                else:
+                    axis_width = height
 
-        if (len(wall_slots) == 0):
-            return
+            # Add a wall to the current region.
+            # randrange() draws the same value as choice(range(...)) would, without building the range.
+            if (axis_width < 3):
+                continue
 
-        wall_index = rng.choice(wall_slots)
-        wall_added = self._add_wall(rng, wall_index, gaps = gaps, vertical = vertical)
+            wall_index = rng.randrange(1, axis_width - 1)
 
-        # If we did not add a wall, then stop.
-        if (not wall_added):
-            return
+            if (vertical):
+                regions = self._add_vertical_wall(rng, anchor_row, anchor_col, height, width, wall_index, gaps = gaps)
+            else:
+                regions = self._add_horizontal_wall(rng, anchor_row, anchor_col, height, width, wall_index, gaps = gaps)
 
-        # Recursively build submazes in the opposite orientation.
-        for submaze in self.submazes:
-            submaze._build_submaze(rng,
-                    gaps = max(1, gaps * gap_factor), gap_factor = gap_factor,
-                    vertical = (not vertical))
+            # If we did not add a wall, then stop.
+            if (len(regions) == 0):
+                continue
+
+            # Build the subregions in the opposite orientation,
+            # pushed in reverse so the first region is built next (depth-first).
+            child_gaps = max(1, gaps * gap_factor)
+            for region in reversed(regions):
+                stack.append(region + (child_gaps, not vertical))
 
     def _place_capture_markers(self, rng: random.Random,
             min_pellets: int = MIN_PELLETS, max_pellets: int = MAX_PELLETS,
@@ -369,37 +408,51 @@ class Maze:
         rng.shuffle(markers)
 
         # Collect all the empty locations, separated into dead-ends and non-dead-ends.
+        # Compute an empty-cell bitmap in one C-level pass (bytearray.translate),
+        # padded with a border of zeros so the neighbor stencil needs no bounds checks.
         dead_ends = []
         non_dead_ends = []
 
+        stride = self._grid_width
+        grid_height = self._grid_height
+        anchor_row = self.anchor.row
+        anchor_col = self.anchor.col
+
+        empty_flags = self.grid.translate(_EMPTY_FLAG_TABLE)
+
+        mask_stride = stride + 2
+        mask = bytearray((grid_height + 2) * mask_stride)
+        for grid_row in range(grid_height):
+            mask_base = ((grid_row + 1) * mask_stride) + 1
+            mask[mask_base:mask_base + stride] = empty_flags[grid_row * stride:(grid_row + 1) * stride]
+
         for row in range(self.height):
-            for col in range(self.width):
-                if (not self.is_marker_relative(row, col, pacai.core.board.MARKER_EMPTY)):
-                    continue
+            mask_row_base = ((anchor_row + row + 1) * mask_stride) + anchor_col + 1
 
-                dead_end = True
-                for offset in pacai.core.board.CARDINAL_OFFSETS.values():
-                    if (not self.is_marker_relative(row + offset.row, col + offset.col, pacai.core.board.MARKER_EMPTY)):
-                        dead_end = False
-                        break
+            # Jump between empty cells with find() (a C-level scan) instead of testing every cell.
+            mask_row = mask[mask_row_base:mask_row_base + self.width]
+            col = mask_row.find(1)
+            while (col != -1):
+                index = mask_row_base + col
 
-                if (dead_end):
+                # A "dead-end" here is a cell whose four (in-bounds) neighbors are all empty.
+                if (mask[index - mask_stride] and mask[index + mask_stride] and mask[index - 1] and mask[index + 1]):
                     dead_ends.append((row, col))
                 else:
                     non_dead_ends.append((row, col))
 
+                col = mask_row.find(1, col + 1)
+
         # Shuffle the filling order, making sure that dead-ends get priority.
         rng.shuffle(dead_ends)
         rng.shuffle(non_dead_ends)
         locations = dead_ends + non_dead_ends
 
-        # Keep filling until we run out of objects or locations.
-        for marker in markers:
-            (row, col) = locations.pop(0)
-            self.place_relative(row, col, marker)
-
-            if (len(locations) == 0):
-                break
+        # Keep filling until we run out of objects or locations
+        # (zip stops at the shorter of the two, no quadratic pop(0) consumption).
+        grid = self.grid
+        for (marker_byte, (row, col)) in zip(map(ord, markers), locations):
+            grid[((anchor_row + row) * stride) + (anchor_col + col)] = marker_byte
 
     def _place_agents(self, rng: random.Random, num_agents: int = DEFAULT_NUM_AGENTS) -> None:
         """
@@ -409,21 +462,39 @@ class Maze:
         Will raise an error if not all agents can be placed.
         """
 
-        agent_indexes = list(range(num_agents))
+        num_placed = 0
+
+        # Work in byte space directly (agent markers are the digit bytes).
+        grid = self.grid
+        stride = self._grid_width
+        anchor_row = self.anchor.row
+        anchor_col = self.anchor.col
+        agent_byte_base = ord(pacai.core.board.MARKER_AGENT_0)
 
         for col in range(self.width):
-            empty_rows = [row for row in range(self.height) if self.is_marker_relative(row, col, pacai.core.board.MARKER_EMPTY)]
+            true_col = anchor_col + col
+            empty_rows = [row for row in range(self.height)
+                    if (grid[((anchor_row + row) * stride) + true_col] == _EMPTY_BYTE)]
             rng.shuffle(empty_rows)
 
             for row in empty_rows:
-                marker = pacai.core.board.Marker(str(agent_indexes.pop(0)))
-                self.place_relative(row, col, marker)
+                grid[((anchor_row + row) * stride) + true_col] = agent_byte_base + num_placed
 
-                if (len(agent_indexes) == 0):
+                num_placed += 1
+                if (num_placed == num_agents):
                     return
 
         raise ValueError("Unable to find enough empty locations to place all agents.")
 
+@functools.lru_cache(maxsize = 16)
+def _wall_template(height: int, width: int) -> bytes:
+    """
+    Get an all-wall board buffer (with inline newlines) of the given dimensions.
+    Random boards only come in a handful of sizes, so the templates are cached per size.
+    """
+
+    return ((pacai.core.board.MARKER_WALL.encode() * width) + b'\n') * height
+
 def generate(
         seed: int | None = None,
         size: int | None = None,
@@ -454,7 +525,7 @@ def generate(
     rng = random.Random(seed)
 
     if (size is None):
-        size = rng.choice(range(MIN_SIZE, MAX_RANDOM_SIZE + 1, 2))
+        size = rng.choice(_RANDOM_SIZES)
 
     if ((size < MIN_SIZE) or (size % 2 != 0)):
         raise ValueError(f"Found disallowed random board size of {size}. Size must be an even number >= {MIN_SIZE}.")
@@ -14,7 +14,7 @@ class GameTest(edq.testing.unittest.BaseTest):
         temp_dir = edq.util.dirent.get_temp_dir(prefix = 'pacai-test-')
         replay_path = os.path.join(temp_dir, 'test.replay')
 
-        expected_score = -10
+        expected_score = -20
 
         # Run a short capture game and save the replay.
         argv = [
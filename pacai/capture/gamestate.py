@@ -33,9 +33,22 @@ PREFIX_MARKERS: set[pacai.core.board.Marker] = {
 }
 """ These markers get prefixed with -/+ when searching for sprites. """
 
+_PREFIXED_MARKERS: dict[tuple[pacai.core.board.Marker, str], pacai.core.board.Marker] = {
+    (marker, prefix): pacai.core.board.Marker(prefix + str(marker))
+    for marker in PREFIX_MARKERS
+    for prefix in ('-', '+')
+}
+""" The prefixed sprite markers, built once (sprite_lookup() runs per tile per frame). """
+
 GHOST_MARKER_PREFIX: str = 'G'
 """ Prefix (non-scared) ghost markers with this. """
 
+_GHOST_MARKERS: dict[pacai.core.board.Marker, pacai.core.board.Marker] = {
+    pacai.core.board.Marker(str(agent_index)): pacai.core.board.Marker(GHOST_MARKER_PREFIX + str(agent_index))
+    for agent_index in range(pacai.core.board.MAX_AGENTS)
+}
+""" The ghost-prefixed form of each agent marker, built once. """
+
 SCORE_COLOR_ZERO: tuple[int, int, int] = (255, 255, 255)
 SCORE_COLOR_NEGATIVE: tuple[int, int, int] = (229, 0, 0)
 SCORE_COLOR_POSITIVE: tuple[int, int, int] = (0, 66, 255)
@@ -50,13 +63,63 @@ class GameState(pacai.pacman.gamestate.GameState):
     The odd team (with odd agent indexes) start in the east and uses a +1 modifier.
     """
 
+    def __init__(self, **kwargs: typing.Any) -> None:
+        super().__init__(**kwargs)
+
+        self._mid_col: int = self.board.width >> 1
+        """
+        The column where the board splits into the two team sides.
+        The board never changes size during a game, so this is computed once
+        and keeps _team_side() to a single integer compare.
+        """
+
+        self._team_agents: tuple[list[int], list[int]] | None = None
+        """
+        The agent indexes split by team (evens, odds), built on first use.
+        The roster is fixed once the game starts, so the split never changes.
+        """
+
+        self._food_left: list[int] | None = None
+        """
+        The number of pellets left on each side of the board ([west, east]), built on first use.
+        Kept up to date as pellets are eaten, so food counts are O(1) instead of a board scan.
+        """
+
+    def copy(self) -> pacai.core.gamestate.GameState:
+        new_state = super().copy()
+        new_state = typing.cast(GameState, new_state)
+
+        # The food counters are mutable, so the copy needs its own.
+        if (self._food_left is not None):
+            new_state._food_left = self._food_left.copy()
+
+        return new_state
+
+    def _food_counts(self) -> list[int]:
+        """ Get (building if necessary) the per-side pellet counts ([west, east]). """
+
+        if (self._food_left is None):
+            mid_col = self._mid_col
+            west_count = 0
+            east_count = 0
+
+            for position in self.board.get_marker_positions(pacai.pacman.board.MARKER_PELLET):
+                if (position.col < mid_col):
+                    west_count += 1
+                else:
+                    east_count += 1
+
+            self._food_left = [west_count, east_count]
+
+        return self._food_left
+
     def _team_modifier(self, agent_index: int = -1) -> int:
         """ Return -1 or +1 depending on if the even or odd team (respectively) is currently active. """
 
         if (agent_index == -1):
             agent_index = self.agent_index
 
-        return ((agent_index % 2) * 2) - 1
+        return TEAM_MODIFIERS[agent_index & 1]
 
     def _team_side(self, agent_index: int = -1, position: pacai.core.board.Position | None = None) -> int:
         """
@@ -74,7 +137,7 @@ class GameState(pacai.pacman.gamestate.GameState):
         if (position is None):
             raise ValueError("Could not find position.")
 
-        if (position.col < (self.board.width / 2)):
+        if (position.col < self._mid_col):
             return -1
 
         return 1
@@ -82,7 +145,14 @@ class GameState(pacai.pacman.gamestate.GameState):
     def _team_agent_indexes(self, team_modifier: int) -> list[int]:
         """ Get the agent indexes for the current team. """
 
-        return [agent_index for agent_index in self.get_agent_indexes() if (self._team_modifier(agent_index) == team_modifier)]
+        if (self._team_agents is None):
+            agent_indexes = self.get_agent_indexes()
+            self._team_agents = (
+                [agent_index for agent_index in agent_indexes if (agent_index % 2 == 0)],
+                [agent_index for agent_index in agent_indexes if (agent_index % 2 == 1)],
+            )
+
+        return self._team_agents[(team_modifier + 1) >> 1]
 
     def get_normalized_score(self, agent_index: int = -1) -> float:
         """
@@ -98,12 +168,12 @@ class GameState(pacai.pacman.gamestate.GameState):
         if (agent_index == -1):
             agent_index = self.agent_index
 
-        position = self.get_agent_position(agent_index = agent_index)
-
+        position = self.board.get_agent_position(agent_index)
         if (position is None):
             return False
 
-        return (self._team_side(agent_index = agent_index) == self._team_modifier(agent_index = agent_index))
+        # On your own side: west (before the midpoint) for evens, east for odds.
+        return ((position.col < self._mid_col) == (agent_index % 2 == 0))
 
     def is_pacman(self, agent_index: int = -1) -> bool:
         """ Check if this agent is currently in "Pac-Man mode", i.e., on the opponent's side of the board. """
@@ -111,19 +181,23 @@ class GameState(pacai.pacman.gamestate.GameState):
         if (agent_index == -1):
             agent_index = self.agent_index
 
-        position = self.get_agent_position(agent_index = agent_index)
-
+        position = self.board.get_agent_position(agent_index)
         if (position is None):
             return False
 
-        return (self._team_side(agent_index = agent_index) != self._team_modifier(agent_index = agent_index))
+        # On the opponent's side: east (at or past the midpoint) for evens, west for odds.
+        return ((position.col < self._mid_col) == (agent_index % 2 == 1))
 
     def is_scared(self, agent_index: int = -1) -> bool:
-        # Only ghosts can be scared.
-        if (not self.is_ghost(agent_index)):
+        if (agent_index == -1):
+            agent_index = self.agent_index
+
+        # Check the timer (a dict probe) before the board-backed ghost check.
+        if (self.scared_timers.get(agent_index, 0) <= 0):
             return False
 
-        return super().is_scared(agent_index = agent_index)
+        # Only ghosts can be scared.
+        return self.is_ghost(agent_index)
 
     def process_agent_timeout(self, agent_index: int) -> None:
         # Treat timeouts like crashes.
@@ -133,7 +207,7 @@ class GameState(pacai.pacman.gamestate.GameState):
         super().process_agent_crash(agent_index)
 
         # Set the score in favor of the non-crashing team.
-        self.score = -1 * self._team_modifier(agent_index) * pacai.pacman.gamestate.CRASH_POINTS
+        self.score = -1 * TEAM_MODIFIERS[agent_index & 1] * pacai.pacman.gamestate.CRASH_POINTS
 
     def get_legal_actions(self, position: pacai.core.board.Position | None = None) -> list[pacai.core.action.Action]:
         if (position is None):
@@ -153,7 +227,19 @@ class GameState(pacai.pacman.gamestate.GameState):
         If no agent is specified, use the current agent.
         """
 
-        return len(self.get_food(team_modifier = team_modifier, agent_index = agent_index))
+        if (team_modifier == 0):
+            if (agent_index == -1):
+                agent_index = self.agent_index
+
+            team_modifier = TEAM_MODIFIERS[agent_index & 1]
+
+        # A team's food lives on the opponent's side.
+        food_counts = self._food_counts()
+
+        if (team_modifier == -1):
+            return food_counts[1]
+
+        return food_counts[0]
 
     def get_food(self, team_modifier: int = 0, agent_index: int = -1) -> set[pacai.core.board.Position]:
         """
@@ -167,29 +253,30 @@ class GameState(pacai.pacman.gamestate.GameState):
             if (agent_index == -1):
                 agent_index = self.agent_index
 
-            team_modifier = self._team_modifier(agent_index)
+            team_modifier = TEAM_MODIFIERS[agent_index & 1]
 
-        team_food = set()
-        for position in self.board.get_marker_positions(pacai.pacman.board.MARKER_PELLET):
-            # If the food does not belong to this team, they can eat it.
-            if (self._team_side(position = position) != team_modifier):
-                team_food.add(position)
+        # A team can eat the food on the opponent's side,
+        # so partition with a direct integer compare instead of a _team_side() call per pellet.
+        mid_col = self._mid_col
+        positions = self.board.get_marker_positions(pacai.pacman.board.MARKER_PELLET)
 
-        return team_food
+        if (team_modifier == -1):
+            return {position for position in positions if (position.col >= mid_col)}
+
+        return {position for position in positions if (position.col < mid_col)}
 
     def get_team_positions(self, team_modifier: int) -> dict[int, pacai.core.board.Position]:
         """ Get the position of all agents on the board belonging to the given team. """
 
+        # Only probe the requested team's agents (the cached split) instead of
+        # fetching every agent's position and filtering by parity afterwards.
+        board = self.board
         agents = {}
 
-        for (agent_index, agent_position) in self.get_agent_positions().items():
-            if (team_modifier != self._team_modifier(agent_index)):
-                continue
-
-            if (agent_position is None):
-                continue
-
-            agents[agent_index] = agent_position
+        for agent_index in self._team_agent_indexes(team_modifier):
+            agent_position = board.get_agent_position(agent_index)
+            if (agent_position is not None):
+                agents[agent_index] = agent_position
 
         return agents
 
@@ -199,7 +286,7 @@ class GameState(pacai.pacman.gamestate.GameState):
         if (agent_index == -1):
             agent_index = self.agent_index
 
-        team_modifier = self._team_modifier(agent_index)
+        team_modifier = TEAM_MODIFIERS[agent_index & 1]
 
         agents = self.get_team_positions(team_modifier)
 
@@ -212,13 +299,13 @@ class GameState(pacai.pacman.gamestate.GameState):
         """ Get the position of all scared allies currently on the board. """
 
         allies = self.get_ally_positions(agent_index = agent_index)
-        return {index: position for (index, position) in allies.items() if self.is_scared(index)}
+        return self._filter_by_scared(allies, True)
 
     def get_nonscared_ally_positions(self, agent_index: int = -1) -> dict[int, pacai.core.board.Position]:
         """ Get the position of all non-scared allies currently on the board. """
 
         allies = self.get_ally_positions(agent_index = agent_index)
-        return {index: position for (index, position) in allies.items() if not self.is_scared(index)}
+        return self._filter_by_scared(allies, False)
 
     def get_opponent_positions(self, agent_index: int = -1) -> dict[int, pacai.core.board.Position]:
         """ Get the position of all opponents currently on the board. """
@@ -226,7 +313,7 @@ class GameState(pacai.pacman.gamestate.GameState):
         if (agent_index == -1):
             agent_index = self.agent_index
 
-        team_modifier = self._team_modifier(agent_index)
+        team_modifier = TEAM_MODIFIERS[agent_index & 1]
 
         return self.get_team_positions(-team_modifier)
 
@@ -234,19 +321,48 @@ class GameState(pacai.pacman.gamestate.GameState):
         """ Get the position of all scared opponents currently on the board. """
 
         opponents = self.get_opponent_positions(agent_index = agent_index)
-        return {index: position for (index, position) in opponents.items() if self.is_scared(index)}
+        return self._filter_by_scared(opponents, True)
 
     def get_nonscared_opponent_positions(self, agent_index: int = -1) -> dict[int, pacai.core.board.Position]:
         """ Get the position of all non-scared opponents currently on the board. """
 
         opponents = self.get_opponent_positions(agent_index = agent_index)
-        return {index: position for (index, position) in opponents.items() if not self.is_scared(index)}
+        return self._filter_by_scared(opponents, False)
 
     def get_invader_positions(self, agent_index: int = -1) -> dict[int, pacai.core.board.Position]:
         """ Get the position of all invading opponents (opponents on your side of the board). """
 
         opponents = self.get_opponent_positions(agent_index = agent_index)
-        return {index: position for (index, position) in opponents.items() if self.is_pacman(index)}
+
+        # An invader is a Pac-Man: on the opponent's side of the board.
+        # The positions are already in hand, so check sides directly instead of calling is_pacman() per agent.
+        mid_col = self._mid_col
+        return {index: position for (index, position) in opponents.items()
+                if ((position.col < mid_col) == (index % 2 == 1))}
+
+    def _filter_by_scared(self,
+            agents: dict[int, pacai.core.board.Position],
+            want_scared: bool,
+            ) -> dict[int, pacai.core.board.Position]:
+        """
+        Keep the agents whose scared status matches in a single pass.
+        The positions are already in hand, so the ghost check compares sides directly
+        instead of going back through the board (as is_scared() would per agent).
+        """
+
+        scared_timers = self.scared_timers
+        mid_col = self._mid_col
+
+        filtered = {}
+        for (agent_index, position) in agents.items():
+            # Only ghosts (agents on their own side) can be scared.
+            scared = ((scared_timers.get(agent_index, 0) > 0)
+                    and ((position.col < mid_col) == (agent_index % 2 == 0)))
+
+            if (scared == want_scared):
+                filtered[agent_index] = position
+
+        return filtered
 
     def game_complete(self) -> list[int]:
         # A side wins if there is no food left for them to eat.
@@ -269,20 +385,30 @@ class GameState(pacai.pacman.gamestate.GameState):
             if (self.is_scared(marker.get_agent_index())):
                 marker = pacai.pacman.board.MARKER_SCARED_GHOST
             else:
-                marker = pacai.core.board.Marker(GHOST_MARKER_PREFIX + str(marker))
+                marker = _GHOST_MARKERS[marker]
 
         # Prefix specific markers with a -/+ depending on the side it is on.
         if (marker in PREFIX_MARKERS):
             prefix = '-'
-            if (self._team_side(position = position) > 0):
+            if (position.col >= self._mid_col):
                 prefix = '+'
 
-            marker = pacai.core.board.Marker(prefix + str(marker))
+            marker = _PREFIXED_MARKERS[(marker, prefix)]
 
         return pacai.core.gamestate.GameState.sprite_lookup(self,
                 sprite_sheet, position,
                 marker = marker, action = action, adjacency = adjacency, animation_key = animation_key)
 
+    def to_dict(self) -> dict[str, typing.Any]:
+        data = super().to_dict()
+
+        # Derived from the board and roster, not part of the serialized state.
+        del data['_mid_col']
+        del data['_team_agents']
+        del data['_food_left']
+
+        return data
+
     def get_footer_text(self) -> pacai.core.font.Text | None:
         text = super().get_footer_text()
 
@@ -301,72 +427,89 @@ class GameState(pacai.pacman.gamestate.GameState):
             action: pacai.core.action.Action,
             rng: random.Random | None = None,
             **kwargs: typing.Any) -> None:
-        agent_marker = pacai.core.board.Marker(str(self.agent_index))
-        team_modifier = self._team_modifier()
+        # Hoist the hot attributes into locals (this runs once per agent per turn all game).
+        board = self.board
+        agent_index = self.agent_index
+        scared_timers = self.scared_timers
+
+        agent_marker = pacai.core.board.Marker(str(agent_index))
+        team_modifier = TEAM_MODIFIERS[agent_index & 1]
 
         # Compute the agent's new position.
         old_position = self.get_agent_position()
         if (old_position is None):
             # The agent is currently dead and needs to respawn.
-            new_position = self.board.get_agent_initial_position(self.agent_index)
+            new_position = board.get_agent_initial_position(agent_index)
             if (new_position is None):
-                raise ValueError(f"Cannot find initial position for agent {self.agent_index}.")
+                raise ValueError(f"Cannot find initial position for agent {agent_index}.")
 
-            self.board.place_marker(agent_marker, new_position)
+            board.place_marker(agent_marker, new_position)
         else:
             new_position = old_position.apply_action(action)
 
         # Get all the markers that we are moving into.
-        interaction_markers = set()
+        # Most moves interact with nothing, so avoid allocating an empty set for that case.
+        interaction_markers: typing.Collection[pacai.core.board.Marker] = ()
         if (old_position != new_position):
-            interaction_markers = self.board.get(new_position)
+            interaction_markers = board.get(new_position)
 
             # Since we are moving, pickup the agent from their current location and move them to their new location.
             if (old_position is not None):
-                self.board.remove_marker(agent_marker, old_position)
-                self.board.place_marker(agent_marker, new_position)
+                board.remove_marker(agent_marker, old_position)
+                board.place_marker(agent_marker, new_position)
 
         died = False
 
+        pellet_marker = pacai.pacman.board.MARKER_PELLET
+        capsule_marker = pacai.pacman.board.MARKER_CAPSULE
+
+        # Whether the new position is on this agent's own side (their food/capsules live there).
+        on_own_side = ((new_position.col < self._mid_col) == (team_modifier == -1))
+
         # Process actions for all the markers we are moving onto.
         for interaction_marker in interaction_markers:
-            if (interaction_marker == pacai.pacman.board.MARKER_PELLET):
+            if (interaction_marker == pellet_marker):
                 # Ignore our own food.
-                if (team_modifier == self._team_side(position = new_position)):
+                if (on_own_side):
                     continue
 
                 # Eat a food pellet.
-                self.board.remove_marker(interaction_marker, new_position)
+                board.remove_marker(interaction_marker, new_position)
                 self.score += team_modifier * FOOD_POINTS
 
+                # Keep the per-side counters in step with the board.
+                if (self._food_left is not None):
+                    self._food_left[0 if (new_position.col < self._mid_col) else 1] -= 1
+
                 if (self.food_count(team_modifier = team_modifier) == 0):
                     self.game_over = True
-            elif (interaction_marker == pacai.pacman.board.MARKER_CAPSULE):
+            elif (interaction_marker == capsule_marker):
                 # Ignore our own capsules.
-                if (team_modifier == self._team_side(position = new_position)):
+                if (on_own_side):
                     continue
 
                 # Eat a power capsule, scare all enemy ghosts.
-                self.board.remove_marker(interaction_marker, new_position)
+                board.remove_marker(interaction_marker, new_position)
                 self.score += team_modifier * CAPSULE_POINTS
 
-                # Scare all enemies.
-                for agent_index in self._team_agent_indexes(-team_modifier):
-                    self.scared_timers[agent_index] = pacai.pacman.gamestate.SCARED_TIME
+                # Scare all enemies (one C-level update instead of a Python loop).
+                scared_timers.update(dict.fromkeys(
+                        self._team_agent_indexes(-team_modifier),
+                        pacai.pacman.gamestate.SCARED_TIME))
             elif (interaction_marker.is_agent()):
                 other_agent_index = interaction_marker.get_agent_index()
-                other_team_modifier = self._team_modifier(other_agent_index)
+                other_team_modifier = TEAM_MODIFIERS[other_agent_index & 1]
 
                 if (team_modifier == other_team_modifier):
                     # This is an agent on our team, nothing to do.
                     continue
 
                 # Check if anyone is scared.
-                self_scared = self.is_scared(self.agent_index)
+                self_scared = self.is_scared(agent_index)
                 other_scared = self.is_scared(other_agent_index)
 
                 # Check who is a ghost (agent's on their own side are a ghost).
-                self_ghost = self.is_ghost(self.agent_index)
+                self_ghost = self.is_ghost(agent_index)
                 other_ghost = self.is_ghost(other_agent_index)
 
                 # Check who was eaten (and remove them), what team did the eating, and the points that should be awarded.
@@ -376,7 +519,7 @@ class GameState(pacai.pacman.gamestate.GameState):
                 if ((self_scared and self_ghost) or ((not other_scared) and other_ghost)):
                     # We got eaten, but our marker is already off the board.
                     died = True
-                    self._kill_agent(self.agent_index)
+                    self._kill_agent(agent_index)
 
                     eating_team_modifier = other_team_modifier
 
@@ -386,7 +529,7 @@ class GameState(pacai.pacman.gamestate.GameState):
                         points = KILL_PACMAN_POINTS
                 else:
                     # If we ate the opponent, remove them from the board.
-                    self.board.remove_marker(interaction_marker, new_position)
+                    board.remove_marker(interaction_marker, new_position)
                     self._kill_agent(other_agent_index)
 
                     eating_team_modifier = team_modifier
@@ -400,23 +543,20 @@ class GameState(pacai.pacman.gamestate.GameState):
 
         # The current agent has died, remove their marker.
         if (died):
-            self.board.remove_marker(agent_marker, new_position)
+            board.remove_marker(agent_marker, new_position)
 
         # Decrement the scared timer.
-        if (self.agent_index in self.scared_timers):
-            self.scared_timers[self.agent_index] -= 1
+        if (agent_index in scared_timers):
+            scared_timers[agent_index] -= 1
 
-            if (self.scared_timers[self.agent_index] <= 0):
-                self._stop_scared(self.agent_index)
+            if (scared_timers[agent_index] <= 0):
+                self._stop_scared(agent_index)
 
     def _kill_agent(self, agent_index: int) -> None:
         """ Set the non-board state for killing an agent. """
 
         # Reset the last action.
-        if (agent_index not in self.agent_actions):
-            self.agent_actions[agent_index] = []
-
-        self.agent_actions[agent_index].append(pacai.core.action.STOP)
+        self.add_agent_action(agent_index, pacai.core.action.STOP)
 
         # The agent is no longer scared.
         self._stop_scared(agent_index)
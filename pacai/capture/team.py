@@ -17,42 +17,35 @@ class TeamCreationFunction(typing.Protocol):
         If fewer agent than necessary are supplied, then random agents should be used to fill out the rest of the team.
         """
 
+def _create_team(names: list[str]) -> list[pacai.core.agentinfo.AgentInfo]:
+    """
+    Construct one agent info per name.
+    Infos are mutable (extra_arguments is updated during game setup),
+    so every slot must get its own instance.
+    """
+
+    return [pacai.core.agentinfo.AgentInfo(name = name) for name in names]
+
 def create_team_dummy() -> list[pacai.core.agentinfo.AgentInfo]:
     """
     Create a team with just dummy agents.
     """
 
-    return [
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_DUMMY.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_DUMMY.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_DUMMY.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_DUMMY.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_DUMMY.long),
-    ]
+    return _create_team([pacai.util.alias.AGENT_DUMMY.long] * 5)
 
 def create_team_random() -> list[pacai.core.agentinfo.AgentInfo]:
     """
     Create a team with just random agents.
     """
 
-    return [
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_RANDOM.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_RANDOM.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_RANDOM.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_RANDOM.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_RANDOM.long),
-    ]
+    return _create_team([pacai.util.alias.AGENT_RANDOM.long] * 5)
 
 def create_team_baseline() -> list[pacai.core.agentinfo.AgentInfo]:
     """
     Create a team with balanced defensive and offensive agents.
     """
 
-    return [
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_CAPTURE_OFFENSIVE.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_CAPTURE_DEFENSIVE.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_CAPTURE_OFFENSIVE.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_CAPTURE_DEFENSIVE.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_CAPTURE_OFFENSIVE.long),
-        pacai.core.agentinfo.AgentInfo(name = pacai.util.alias.AGENT_CAPTURE_DEFENSIVE.long),
-    ]
+    return _create_team([
+        pacai.util.alias.AGENT_CAPTURE_OFFENSIVE.long,
+        pacai.util.alias.AGENT_CAPTURE_DEFENSIVE.long,
+    ] * 3)
@@ -14,6 +14,12 @@ class Action(str):
     """
 
     def __new__(cls, raw_text: str, safe: bool = False) -> 'Action':
+        # The canonical actions make up almost all constructions (agents returning moves, parsing replays),
+        # so return the interned instance without any cleaning or allocation.
+        cached = _ACTION_INTERN.get(raw_text)
+        if ((cached is not None) and (cls is Action)):
+            return cached
+
         # If the caller deems the imput "safe" then we will skip all checks and cleaning,
         # and return just the input string.
         if (safe):
@@ -27,6 +33,9 @@ class Action(str):
 
         return text
 
+_ACTION_INTERN: dict[str, 'Action'] = {}
+""" The canonical actions (and their lowercase spellings) keyed by text, filled in below. """
+
 def get_reverse_direction(action: Action) -> Action | None:
     """
     If this action is a cardinal direction, return the reveres direction.
@@ -53,6 +62,10 @@ The action for moving stopping and not doing anything.
 This action is often used as a catchall and should always be valid in most games.
 """
 
+for _action in (NORTH, EAST, SOUTH, WEST, STOP):
+    _ACTION_INTERN[str(_action)] = _action
+    _ACTION_INTERN[str(_action).lower()] = _action
+
 CARDINAL_DIRECTIONS: list[Action] = [
     NORTH,
     EAST,
@@ -1,4 +1,5 @@
-import abc
+import collections
+import functools
 import logging
 import random
 import typing
@@ -10,7 +11,29 @@ import pacai.core.gamestate
 import pacai.util.alias
 import pacai.util.reflection
 
-class Agent(abc.ABC):
+_STOP: pacai.core.action.Action = pacai.core.action.STOP
+"""
+A module-local binding of the STOP action.
+The default agent methods return it on every uneventful call,
+and a global lookup here is cheaper than the module attribute chain.
+"""
+
+_STOP_AGENT_ACTION: pacai.core.agentaction.AgentAction = pacai.core.agentaction.AgentAction(_STOP)
+"""
+A shared plain STOP agent action.
+Every game-boundary call and every idle turn returns one of these,
+so the default paths reuse this instance (treated as read-only by all callers)
+instead of allocating a fresh one.
+"""
+
+_PLACEHOLDER_RNG: random.Random = random.Random(4)
+"""
+A shared placeholder RNG for agents that have not started a game yet.
+game_start_full() replaces it with a per-agent seeded instance,
+so paying for a fresh Mersenne Twister state per construction is wasted work in bulk setups.
+"""
+
+class Agent:
     """
     The base for all agents in the pacai system.
 
@@ -30,6 +53,26 @@ class Agent(abc.ABC):
     and instead do that work in game_start_full()/game_start() (where they will have access to the game state).
     """
 
+    LAST_POSITIONS_CAP: typing.ClassVar[int | None] = 64
+    """
+    The maximum number of entries kept in last_positions
+    (None keeps the full history).
+    Games can run for thousands of turns and almost no agent looks past the last few entries,
+    so the history is bounded by default.
+    """
+
+    EVAL_CACHE_SIZE: typing.ClassVar[int] = 0
+    """
+    When positive, evaluate_state() memoizes results in a bounded table
+    keyed by (state hash, agent index, action), evicting the oldest entries on overflow.
+    This is off by default: it is only sound when the evaluation function is a pure function of the state
+    (e.g., not an evaluation whose weights change while training).
+    Adversarial agents that re-reach the same states across turns can enable it by overriding this attribute.
+    """
+
+    __slots__ = ('name', 'move_delay', 'evaluation_function', 'rng', 'agent_index',
+            'last_positions', 'training', 'training_epoch', 'extra_storage', '_eval_cache')
+
     def __init__(self,
             name: pacai.util.reflection.Reference | str = pacai.util.alias.AGENT_DUMMY.long,
             move_delay: int = pacai.core.agentinfo.DEFAULT_MOVE_DELAY,
@@ -38,7 +81,7 @@ class Agent(abc.ABC):
             training: bool = False,
             training_epoch: int = 0,
             **kwargs: typing.Any) -> None:
-        self.name: pacai.util.reflection.Reference = pacai.util.reflection.Reference(name)
+        self.name: pacai.util.reflection.Reference = pacai.util.reflection.Reference.intern(name)
         """ The name of this agent. """
 
         self.move_delay: int = move_delay
@@ -55,11 +98,11 @@ class Agent(abc.ABC):
         self.evaluation_function: pacai.core.gamestate.AgentStateEvaluationFunction = clean_state_eval_func
         """ The evaluation function that agent will use to assess game states. """
 
-        self.rng: random.Random = random.Random(4)
+        self.rng: random.Random = _PLACEHOLDER_RNG
         """
         The RNG this agent should use whenever it wants randomness.
-        This object will be constructed right away,
-        but will be recreated with the suggested seed from the game engine during game_start_full().
+        This starts as a shared placeholder (which should not be used before the game starts),
+        and is replaced with an instance seeded by the game engine during game_start_full().
         """
 
         self.agent_index: int = -1
@@ -68,9 +111,9 @@ class Agent(abc.ABC):
         It is initialized to -1 (before the game starts), but gets populated during game_start_full().
         """
 
-        self.last_positions: list[pacai.core.board.Position | None] = []
+        self.last_positions: collections.deque[pacai.core.board.Position | None] = collections.deque(maxlen = self.LAST_POSITIONS_CAP)
         """
-        Keep track of the last positions this agent was in.
+        Keep track of the last positions this agent was in (up to LAST_POSITIONS_CAP entries).
         This is updated in the beginning of get_action_full().
         This will include times when the agent was not on the board (a None position).
         """
@@ -84,10 +127,15 @@ class Agent(abc.ABC):
         self.extra_storage: dict[str, typing.Any] = {}
         """ An extra place that can be used by and agent subcomponents for persistent storage. """
 
-        logging.debug("Created agent '%s' with move delay %d and state evaluation function '%s'.",
-                pacai.util.reflection.get_qualified_name(self.name),
-                self.move_delay,
-                pacai.util.reflection.get_qualified_name(state_eval_func))
+        self._eval_cache: collections.OrderedDict[tuple[int, int, pacai.core.action.Action | None], float] = collections.OrderedDict()
+        """ Memoized evaluate_state() results (only used when EVAL_CACHE_SIZE is positive). """
+
+        # Only pay for the qualified name lookups when debug logging is actually on.
+        if (logging.getLogger().getEffectiveLevel() <= logging.DEBUG):
+            logging.debug("Created agent '%s' with move delay %d and state evaluation function '%s'.",
+                    pacai.util.reflection.get_qualified_name(self.name),
+                    self.move_delay,
+                    pacai.util.reflection.get_qualified_name(state_eval_func))
 
     def get_action_full(self,
             state: pacai.core.gamestate.GameState,
@@ -107,6 +155,9 @@ class Agent(abc.ABC):
 
         action = self.get_action(state)
 
+        if (action is _STOP):
+            return _STOP_AGENT_ACTION
+
         return pacai.core.agentaction.AgentAction(action)
 
     def get_action(self, state: pacai.core.gamestate.GameState) -> pacai.core.action.Action:
@@ -116,7 +167,7 @@ class Agent(abc.ABC):
         see that method for full details.
         """
 
-        return pacai.core.action.STOP
+        return _STOP
 
     def game_start_full(self,
             agent_index: int,
@@ -136,7 +187,7 @@ class Agent(abc.ABC):
 
         self.game_start(initial_state)
 
-        return pacai.core.agentaction.AgentAction(pacai.core.action.STOP)
+        return _STOP_AGENT_ACTION
 
     def game_start(self,
             initial_state: pacai.core.gamestate.GameState,
@@ -159,7 +210,7 @@ class Agent(abc.ABC):
 
         self.game_complete(final_state)
 
-        return pacai.core.agentaction.AgentAction(pacai.core.action.STOP)
+        return _STOP_AGENT_ACTION
 
     def game_complete(self,
             final_state: pacai.core.gamestate.GameState,
@@ -177,9 +228,59 @@ class Agent(abc.ABC):
         Evaluate the state to get a decide how good an action was.
         The base implementation for this function just calls `self.evaluation_function`,
         but child classes may override this method to easily implement their own evaluations.
+        See EVAL_CACHE_SIZE for optional memoization.
         """
 
-        return self.evaluation_function(state, agent = self, action = action, **kwargs)
+        if (self.EVAL_CACHE_SIZE <= 0):
+            return self.evaluation_function(state, agent = self, action = action, **kwargs)
+
+        key = (hash(state), self.agent_index, action)
+        cached_score = self._eval_cache.get(key)
+        if (cached_score is not None):
+            self._eval_cache.move_to_end(key)
+            return cached_score
+
+        score = self.evaluation_function(state, agent = self, action = action, **kwargs)
+
+        self._eval_cache[key] = score
+        if (len(self._eval_cache) > self.EVAL_CACHE_SIZE):
+            self._eval_cache.popitem(last = False)
+
+        return score
+
+    def batch_evaluate(self,
+            states: list[pacai.core.gamestate.GameState],
+            actions: list[pacai.core.action.Action | None],
+            **kwargs: typing.Any) -> list[float]:
+        """
+        Evaluate several (state, action) pairs at once.
+        Search agents evaluate every frontier node of a turn in one burst,
+        so this hoists the per-call dispatch (attribute and method lookups) out of the loop.
+        Evaluation functions that can score a whole batch themselves may advertise
+        a `batched` attribute (a callable taking the state and action lists),
+        which will be used instead of the per-pair loop.
+        """
+
+        batched = getattr(self.evaluation_function, 'batched', None)
+        if (batched is not None):
+            return list(batched(states, actions, agent = self, **kwargs))
+
+        if (self.EVAL_CACHE_SIZE > 0):
+            evaluate_state = self.evaluate_state
+            return [evaluate_state(state, action = action, **kwargs) for (state, action) in zip(states, actions)]
+
+        evaluation_function = self.evaluation_function
+        return [evaluation_function(state, agent = self, action = action, **kwargs) for (state, action) in zip(states, actions)]
+
+@functools.lru_cache(maxsize = 128)
+def _fetch_agent_class(reference_text: str) -> type:
+    """
+    Fetch the class an agent reference points to.
+    Training loops construct agents with the same references every epoch,
+    so the import and attribute walk is cached by the reference string.
+    """
+
+    return pacai.util.reflection.fetch(reference_text)
 
 def load(agent_info: pacai.core.agentinfo.AgentInfo) -> Agent:
     """
@@ -187,7 +288,8 @@ def load(agent_info: pacai.core.agentinfo.AgentInfo) -> Agent:
     The name of the agent will be used as a reference to (e.g., name of) the agent's class.
     """
 
-    agent = pacai.util.reflection.new_object(agent_info.name, **agent_info.to_flat_dict())
+    agent_class = _fetch_agent_class(str(agent_info.name))
+    agent = agent_class(**agent_info.to_flat_dict())
 
     if (not isinstance(agent, Agent)):
         raise ValueError(f"Loaded class is not an agent: '{agent_info.name}'.")
@@ -16,6 +16,8 @@ class AgentAction(edq.util.json.DictConverter):
     Agent's usually just provide actions, but more information can be supplied if necessary.
     """
 
+    __slots__ = ('action', 'board_highlights', 'clear_inputs', 'training_info', 'other_info')
+
     def __init__(self,
             action: pacai.core.action.Action = pacai.core.action.STOP,
             board_highlights: list[pacai.core.board.Highlight] | None = None,
@@ -58,15 +60,57 @@ class AgentAction(edq.util.json.DictConverter):
         """
 
     def to_dict(self) -> dict[str, typing.Any]:
-        data = vars(self).copy()
-        data['board_highlights'] = [board_highlight.to_dict() for board_highlight in self.board_highlights]
-        return data
+        # The default response (STOP with no extras) dominates in long games,
+        # so that case shares one pre-built dict (treated as read-only by all callers).
+        if ((self.action == pacai.core.action.STOP)
+                and (not self.board_highlights)
+                and (not self.clear_inputs)
+                and (not self.training_info)
+                and (not self.other_info)):
+            return _DEFAULT_ACTION_DICT
+
+        # Highlights are empty for nearly every action, so skip the comprehension in that case.
+        board_highlights: list[dict[str, typing.Any]] = []
+        if (self.board_highlights):
+            board_highlights = [board_highlight.to_dict() for board_highlight in self.board_highlights]
+
+        return {
+            'action': self.action,
+            'board_highlights': board_highlights,
+            'clear_inputs': self.clear_inputs,
+            'training_info': self.training_info,
+            'other_info': self.other_info,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> typing.Any:
-        data = data.copy()
-        data['board_highlights'] = [pacai.core.board.Highlight.from_dict(raw_highligh) for raw_highligh in data['board_highlights']]
-        return cls(**data)
+        # Replays load millions of these records,
+        # so the fields are assigned directly instead of paying for keyword binding in __init__.
+        # The data is trusted (it came from to_dict()),
+        # but saved logs may omit default-valued keys.
+        agent_action = cls.__new__(cls)
+
+        agent_action.action = data.get('action', pacai.core.action.STOP)
+
+        board_highlights: list[pacai.core.board.Highlight] = []
+        if (data.get('board_highlights')):
+            board_highlights = [pacai.core.board.Highlight.from_dict(raw_highligh) for raw_highligh in data['board_highlights']]
+
+        agent_action.board_highlights = board_highlights
+        agent_action.clear_inputs = data.get('clear_inputs', False)
+        agent_action.training_info = data.get('training_info') or {}
+        agent_action.other_info = data.get('other_info') or {}
+
+        return agent_action
+
+_DEFAULT_ACTION_DICT: dict[str, typing.Any] = {
+    'action': pacai.core.action.STOP,
+    'board_highlights': [],
+    'clear_inputs': False,
+    'training_info': {},
+    'other_info': {},
+}
+""" The shared serialization of a default (STOP, no extras) agent action, treat as read-only. """
 
 class AgentActionRecord(edq.util.json.DictConverter):
     """
@@ -75,6 +119,8 @@ class AgentActionRecord(edq.util.json.DictConverter):
     this class contains administrative fields used to keep track of the agent.
     """
 
+    __slots__ = ('agent_index', 'agent_action', 'duration', 'crashed', 'timeout')
+
     def __init__(self,
             agent_index: int,
             agent_action: AgentAction | None,
@@ -132,10 +178,15 @@ class AgentActionRecord(edq.util.json.DictConverter):
 
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> typing.Any:
+        # Nested loaders may have already converted the duration.
+        duration = data['duration']
+        if (not isinstance(duration, edq.util.time.Duration)):
+            duration = edq.util.time.Duration(duration)
+
         return cls(
             agent_index = data['agent_index'],
             agent_action = AgentAction.from_dict(data['agent_action']) if data['agent_action'] is not None else None,
-            duration = edq.util.time.Duration(data['duration']),
+            duration = duration,
             crashed = data.get('crashed', False),
             timeout = data.get('timeout', False),
         )
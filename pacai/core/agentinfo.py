@@ -20,16 +20,15 @@ class AgentInfo(edq.util.json.DictConverter):
     that can be serialized/deserialized via the standard Python JSON library.
     """
 
+    __slots__ = ('name', 'move_delay', 'state_eval_func', 'extra_arguments')
+
     def __init__(self,
             name: str | pacai.util.reflection.Reference = '',
             move_delay: int | None = DEFAULT_MOVE_DELAY,
             state_eval_func: pacai.util.reflection.Reference | str = DEFAULT_STATE_EVAL,
             extra_arguments: dict[str, typing.Any] | None = None,
             **kwargs: typing.Any) -> None:
-        if (isinstance(name, str)):
-            name = pacai.util.reflection.Reference(name)
-
-        self.name: pacai.util.reflection.Reference = name
+        self.name: pacai.util.reflection.Reference = pacai.util.reflection.Reference.intern(name)
         """ The name of the agent's class. """
 
         if (move_delay is None):
@@ -41,28 +40,29 @@ class AgentInfo(edq.util.json.DictConverter):
         self.move_delay: int = move_delay
         """ The move delay of the agent. """
 
-        self.state_eval_func: pacai.util.reflection.Reference = pacai.util.reflection.Reference(state_eval_func)
+        self.state_eval_func: pacai.util.reflection.Reference = pacai.util.reflection.Reference.intern(state_eval_func)
         """ The state evaluation function this agent will use. """
 
-        self.extra_arguments: dict[str, typing.Any] = {}
+        # The **kwargs dict is freshly built for this call, so it can be adopted directly
+        # instead of copying its entries into a new dict.
+        if (extra_arguments is not None):
+            kwargs.update(extra_arguments)
+
+        self.extra_arguments: dict[str, typing.Any] = kwargs
         """
         Additional arguments to the agent.
         These are typically used by agent subclasses.
         """
 
-        self.extra_arguments.update(kwargs)
-        if (extra_arguments is not None):
-            self.extra_arguments.update(extra_arguments)
-
     def set_from_string(self, name: str, value: str) -> None:
         """ Set an attribute by name. """
 
         if (name == 'name'):
-            self.name = pacai.util.reflection.Reference(value)
+            self.name = pacai.util.reflection.Reference.intern(value)
         elif (name == 'move_delay'):
             self.move_delay = int(value)
         elif (name == 'state_eval_func'):
-            self.state_eval_func = pacai.util.reflection.Reference(value)
+            self.state_eval_func = pacai.util.reflection.Reference.intern(value)
         else:
             self.extra_arguments[name] = value
 
@@ -80,26 +80,36 @@ class AgentInfo(edq.util.json.DictConverter):
         where the extra arguments are on the same level as name and move_delay.
         """
 
-        result = self.extra_arguments.copy()
-
-        result['name'] = self.name
-        result['move_delay'] = self.move_delay
-        result['state_eval_func'] = str(self.state_eval_func)
-
-        return result
+        return {
+            **self.extra_arguments,
+            'name': self.name,
+            'move_delay': self.move_delay,
+            'state_eval_func': str(self.state_eval_func),
+        }
 
     def to_dict(self) -> dict[str, typing.Any]:
-        data = vars(self).copy()
-        data['name'] = self.name.to_dict()
-        data['state_eval_func'] = self.state_eval_func.to_dict()
-        return data
+        return {
+            'name': self.name.to_dict(),
+            'move_delay': self.move_delay,
+            'state_eval_func': self.state_eval_func.to_dict(),
+            'extra_arguments': self.extra_arguments,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> typing.Any:
-        data = data.copy()
-        data['name'] = pacai.util.reflection.Reference.from_dict(data['name'])
+        # Saved games carry an info per agent per game,
+        # so the fields are assigned directly instead of paying for keyword binding in __init__.
+        # The data is trusted (it came from to_dict()).
+        info = cls.__new__(cls)
+
+        info.name = pacai.util.reflection.Reference.from_dict(data['name'])
+        info.move_delay = data.get('move_delay', DEFAULT_MOVE_DELAY)
 
         if ('state_eval_func' in data):
-            data['state_eval_func'] = pacai.util.reflection.Reference.from_dict(data['state_eval_func'])
+            info.state_eval_func = pacai.util.reflection.Reference.from_dict(data['state_eval_func'])
+        else:
+            info.state_eval_func = pacai.util.reflection.Reference.intern(DEFAULT_STATE_EVAL)
+
+        info.extra_arguments = dict(data.get('extra_arguments', ()))
 
-        return cls(**data)
+        return info
@@ -204,6 +204,8 @@ class Highlight(edq.util.json.DictConverter):
     A class representing a request to highlight/emphasize a position on the board.
     """
 
+    __slots__ = ('position', 'intensity')
+
     def __init__(self,
             position: Position,
             intensity: int | float | None,
@@ -549,6 +551,19 @@ class Board(edq.util.json.DictConverter):
 
         markers.discard(position)
 
+    def clear_marker(self, marker: Marker) -> None:
+        """
+        Remove the specified marker from every position on the board in one operation.
+        """
+
+        self._copy_on_write()
+
+        markers = self._nonwall_objects.get(marker)
+        if (markers is None):
+            return
+
+        markers.clear()
+
     def place_marker(self, marker: Marker, position: Position) -> None:
         """
         Place a marker at the given position.
@@ -686,6 +701,28 @@ class Board(edq.util.json.DictConverter):
 
         return '||'.join(raw_nonwall_objects)
 
+    def state_hash(self) -> int:
+        """
+        Get a hash of the variable (non-wall) contents of this board.
+        Boards with the same markers (including agents) at the same positions will hash the same,
+        regardless of the history that produced them.
+        """
+
+        result = 0
+        for (marker, positions) in self._nonwall_objects.items():
+            result ^= hash((marker, frozenset(positions)))
+
+        return result
+
+    def state_key(self) -> frozenset:
+        """
+        Get a hashable exact representation of the variable (non-wall) contents of this board.
+        Unlike state_hash(), equal keys guarantee equal contents,
+        so keys are safe to use in dicts/sets (hash collisions are resolved by equality).
+        """
+
+        return frozenset((marker, frozenset(positions)) for (marker, positions) in self._nonwall_objects.items())
+
     def to_grid(self) -> list[list[Marker]]:
         """ Convert this board to a 2-d grid. """
 
@@ -60,6 +60,20 @@ class BoardTest(edq.testing.unittest.BaseTest):
                 if (error_substring is not None):
                     self.fail(f"Did not get expected error: '{error_substring}'.")
 
+    def test_clear_marker(self):
+        """ Test removing all of a marker's positions in one operation. """
+
+        board = pacai.core.board.load_string('test', TEST_BOARD_PELLETS, additional_markers = ['.'])
+        marker = pacai.core.board.Marker('.')
+
+        self.assertEqual(board.get_marker_count(marker), 3)
+
+        board.clear_marker(marker)
+        self.assertEqual(board.get_marker_count(marker), 0)
+
+        # Clearing a marker that is not on the board should be a no-op.
+        board.clear_marker(pacai.core.board.Marker('o'))
+
 TEST_BOARD_NO_SEP = '''
 %%%
 % %
@@ -99,6 +113,13 @@ TEST_BOARD_AGENTS_NUMBERS = '''
 %%%%%
 '''
 
+TEST_BOARD_PELLETS = '''
+%%%%%
+%. .%
+%  .%
+%%%%%
+'''
+
 TEST_BOARD_ERROR_DUP_AGENTS = '''
 %%%%%
 %0 0%
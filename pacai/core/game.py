@@ -509,6 +509,12 @@ def set_cli_args(parser: argparse.ArgumentParser, default_board: str | None = No
             action = 'store', type = int, default = 0,
             help = 'The number of games to play in training mode before playing `--num-games` real games (default: %(default)s).')
 
+    parser.add_argument('--parallel', dest = 'parallel',
+            action = 'store', type = int, default = 1,
+            help = ('Run up to this many non-training games at the same time (each in its own process) (default: %(default)s).'
+                    + ' Training games always run serially (each epoch feeds the next).'
+                    + ' Not available on Windows.'))
+
     parser.add_argument('--seed', dest = 'seed',
             action = 'store', type = int, default = None,
             help = 'The random seed for the game (will be randomly generated if not set.')
@@ -65,6 +65,12 @@ class GameState(edq.util.json.DictConverter):
         self.agent_actions: dict[int, list[pacai.core.action.Action]] = agent_actions
         """ Keep track of the actions that each agent makes. """
 
+        self._agent_actions_shallow: bool = False
+        """
+        Keep track of if the action history is shared with another state (see copy()).
+        The history is only deep copied when a shared state needs to record a new action.
+        """
+
         self.score: float = score
         """ The current score of the game. """
 
@@ -94,6 +100,15 @@ class GameState(edq.util.json.DictConverter):
             for (info_agent_index, agent_info) in agent_infos.items():
                 self.move_delays[info_agent_index] = agent_info.move_delay
 
+    def __hash__(self) -> int:
+        """
+        Hash the gameplay-relevant parts of this state (board contents, active agent, and score).
+        States reached via different action orderings will hash the same,
+        which allows search agents to detect transpositions.
+        """
+
+        return hash((self.agent_index, self.score, self.board.state_hash()))
+
     def copy(self) -> 'GameState':
         """
         Get a deep copy of this state.
@@ -104,10 +119,14 @@ class GameState(edq.util.json.DictConverter):
         new_state = copy.copy(self)
 
         new_state.board = self.board.copy()
-        new_state.agent_actions = {agent_index: actions.copy() for (agent_index, actions) in self.agent_actions.items()}
         new_state.move_delays = self.move_delays.copy()
         new_state.tickets = self.tickets.copy()
 
+        # Share the action history copy-on-write,
+        # whichever state records the next action will copy it first (see add_agent_action()).
+        self._agent_actions_shallow = True
+        new_state._agent_actions_shallow = True
+
         return new_state
 
     def game_start(self) -> None:
@@ -169,7 +188,11 @@ class GameState(edq.util.json.DictConverter):
         return self.board.get_agent_position(agent_index)
 
     def get_agent_actions(self, agent_index: int | None = None) -> list[pacai.core.action.Action]:
-        """ Get the previous actions of the specified agent (or current agent if no agent is specified). """
+        """
+        Get the previous actions of the specified agent (or current agent if no agent is specified).
+        The returned list may be internal state (possibly shared with other states) and should not be modified,
+        use add_agent_action() to record new actions.
+        """
 
         if (agent_index is None):
             agent_index = self.agent_index
@@ -177,10 +200,22 @@ class GameState(edq.util.json.DictConverter):
         if (agent_index < 0):
             return []
 
+        return self.agent_actions.get(agent_index, [])
+
+    def add_agent_action(self, agent_index: int, action: pacai.core.action.Action) -> None:
+        """
+        Record an action taken by the given agent.
+        This handles the copy-on-write bookkeeping for action histories shared between states.
+        """
+
+        if (self._agent_actions_shallow):
+            self.agent_actions = {index: actions.copy() for (index, actions) in self.agent_actions.items()}
+            self._agent_actions_shallow = False
+
         if (agent_index not in self.agent_actions):
             self.agent_actions[agent_index] = []
 
-        return self.agent_actions[agent_index]
+        self.agent_actions[agent_index].append(action)
 
     def get_last_agent_action(self, agent_index: int | None = None) -> pacai.core.action.Action | None:
         """ Get the last action of the specified agent (or current agent if no agent is specified). """
@@ -217,6 +252,22 @@ class GameState(edq.util.json.DictConverter):
 
         return successor
 
+    def generate_successor_sequence(self,
+            actions: list[pacai.core.action.Action],
+            rng: random.Random | None = None,
+            **kwargs: typing.Any) -> 'GameState':
+        """
+        Create a new deep copy of this state that represents the given sequence of actions being taken in order.
+        Only one copy is made (and then mutated in place per action),
+        so this avoids the intermediate clones that chaining generate_successor() calls would create.
+        """
+
+        successor = self.copy()
+        for action in actions:
+            successor.process_turn_full(action, rng, **kwargs)
+
+        return successor
+
     def process_agent_timeout(self, agent_index: int) -> None:
         """
         Notify the state that the given agent has timed out.
@@ -273,10 +324,7 @@ class GameState(edq.util.json.DictConverter):
         self.process_turn(action, rng, **kwargs)
 
         # Track this last action.
-        if (self.agent_index not in self.agent_actions):
-            self.agent_actions[self.agent_index] = []
-
-        self.agent_actions[self.agent_index].append(action)
+        self.add_agent_action(self.agent_index, action)
 
         # Issue this agent a new ticket.
         self.tickets[self.agent_index] = self.tickets[self.agent_index].next(self.compute_move_delay(self.agent_index))
@@ -367,6 +415,7 @@ class GameState(edq.util.json.DictConverter):
 
     def to_dict(self) -> dict[str, typing.Any]:
         data = vars(self).copy()
+        del data['_agent_actions_shallow']
 
         data['board'] = self.board.to_dict()
         data['tickets'] = {agent_index: ticket.to_dict() for (agent_index, ticket) in sorted(self.tickets.items())}
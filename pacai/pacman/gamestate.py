@@ -330,10 +330,7 @@ class GameState(pacai.core.gamestate.GameState):
         self.score += GHOST_POINTS
 
         # Reset the last action.
-        if (agent_index not in self.agent_actions):
-            self.agent_actions[agent_index] = []
-
-        self.agent_actions[agent_index].append(pacai.core.action.STOP)
+        self.add_agent_action(agent_index, pacai.core.action.STOP)
 
         # The ghost is no longer scared.
         self._stop_scared(agent_index)
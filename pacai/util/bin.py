@@ -1,6 +1,9 @@
 import argparse
 import logging
+import multiprocessing
+import sys
 import typing
+import queue as pyqueue
 
 import pacai.core.agentaction
 import pacai.core.agentinfo
@@ -13,6 +16,15 @@ import pacai.util.alias
 SCORE_LIST_MAX_INFO_LENGTH: int = 50
 """ If a score list is less than this, log it to info. """
 
+_WORKER_POLL_SECS: float = 0.25
+""" How long to wait on the parallel result queue before checking worker health. """
+
+_WORKER_JOIN_SECS: float = 0.25
+""" How long to wait for a game worker to join before terminating it (see _join_worker()). """
+
+_WORKER_REAP_SECS: float = 0.10
+""" How long to wait for a terminated game worker before killing it. """
+
 @typing.runtime_checkable
 class SetCLIArgs(typing.Protocol):
     """
@@ -259,18 +271,24 @@ def run_games(
             if (agent_record.agent_action is not None):
                 training_infos[agent_index] = agent_record.agent_action.training_info
 
-    results = []
-
+    # Set any information gained from training.
     for i in range(args.num_games):
         game = args._games[i + args.num_training]
-        ui = args._uis[i + args.num_training]
-
-        # Set any information gained from training.
         for (agent_index, training_info) in training_infos.items():
             game.game_info.agent_infos[agent_index].extra_arguments.update(training_info)
 
-        result = game.run(ui)
-        results.append(result)
+    # Non-training games are independent of each other and may run in parallel.
+    parallel = max(1, int(getattr(args, 'parallel', 1)))
+    if ((parallel > 1) and (args.num_games > 1) and (not sys.platform.startswith('win'))):
+        results = _run_games_parallel(args, parallel)
+    else:
+        results = []
+        for i in range(args.num_games):
+            game = args._games[i + args.num_training]
+            ui = args._uis[i + args.num_training]
+
+            result = game.run(ui)
+            results.append(result)
 
     if (len(training_results) > 0):
         if (log_results is not None):
@@ -281,3 +299,90 @@ def run_games(
             log_results(results, winning_agent_indexes)
 
     return training_results, results
+
+def _run_games_parallel(args: argparse.Namespace, parallel: int) -> list[pacai.core.game.GameResult]:
+    """
+    Run the non-training games in waves of processes (at most `parallel` at a time).
+    Each game runs in its own process (see pacai.core.isolation.process for the same approach applied to agents),
+    and results come back over a queue.
+    Queue reads are bounded so a worker that dies without posting a result
+    (e.g., a crash inside the game) raises an error instead of deadlocking the run.
+    """
+
+    results: list[pacai.core.game.GameResult | None] = [None] * args.num_games
+
+    # Cannot consistently type multiprocessing.Queue before 3.11.
+    result_queue: multiprocessing.Queue = multiprocessing.Queue()
+
+    for wave_start in range(0, args.num_games, parallel):
+        wave_indexes = range(wave_start, min(wave_start + parallel, args.num_games))
+
+        processes = {}
+        for i in wave_indexes:
+            game = args._games[i + args.num_training]
+            ui = args._uis[i + args.num_training]
+
+            process = multiprocessing.Process(target = _run_game_worker, args = (i, game, ui, result_queue))
+            process.start()
+            processes[i] = process
+
+        try:
+            _collect_wave_results(processes, result_queue, results)
+        finally:
+            for process in processes.values():
+                _join_worker(process)
+
+    return typing.cast(list[pacai.core.game.GameResult], results)
+
+def _collect_wave_results(
+        processes: dict[int, multiprocessing.Process],
+        result_queue: multiprocessing.Queue,
+        results: list[pacai.core.game.GameResult | None],
+        ) -> None:
+    """
+    Collect one result from each worker in a wave,
+    raising an error if a worker exits without posting a result.
+    """
+
+    pending = set(processes.keys())
+    while (len(pending) > 0):
+        try:
+            (game_index, result) = result_queue.get(True, _WORKER_POLL_SECS)
+        except pyqueue.Empty:
+            dead_indexes = [game_index for game_index in pending if (not processes[game_index].is_alive())]
+            if (len(dead_indexes) == 0):
+                continue
+
+            # A dead worker's result may still be in the queue's buffer, so give it one more bounded read.
+            try:
+                (game_index, result) = result_queue.get(True, _WORKER_POLL_SECS)
+            except pyqueue.Empty:
+                process = processes[dead_indexes[0]]
+                raise ValueError(f"Parallel game worker for game {dead_indexes[0]} exited"
+                        + f" (exit code {process.exitcode}) without returning a result.") from None
+
+        results[game_index] = result
+        pending.discard(game_index)
+
+def _join_worker(process: multiprocessing.Process) -> None:
+    """ Join a game worker with bounded waits (terminating and then killing it if it will not exit). """
+
+    process.join(_WORKER_JOIN_SECS)
+
+    # Check to see if the process is still running.
+    if (process.is_alive()):
+        # Kill the long-running process.
+        process.terminate()
+
+        # Try to reap the process once before just giving up on it.
+        process.join(_WORKER_REAP_SECS)
+
+        # Try to kill the process if it is still alive.
+        if (process.is_alive()):
+            process.kill()
+
+def _run_game_worker(game_index: int, game: pacai.core.game.Game, ui: pacai.core.ui.UI, result_queue: typing.Any) -> None:
+    """ Run a single game in a worker process and send its result back over the queue. """
+
+    result = game.run(ui)
+    result_queue.put((game_index, result))
@@ -48,8 +48,14 @@ class Reference(edq.util.json.DictConverter):
         self.short_name: str = short_name
         """ The short_name component of the reflection reference (or None). """
 
+        self._text: str | None = None
+        """ The cached string form of this reference (built on first use). """
+
     def __str__(self) -> str:
-        return Reference.build_string(self.short_name, self.file_path, self.module_name)
+        if (self._text is None):
+            self._text = Reference.build_string(self.short_name, self.file_path, self.module_name)
+
+        return self._text
 
     def __repr__(self) -> str:
         return str(self)
@@ -110,14 +116,39 @@ class Reference(edq.util.json.DictConverter):
 
         return file_path, module_name, short_name
 
+    @staticmethod
+    def intern(raw_input: typing.Union[str, 'Reference']) -> 'Reference':
+        """
+        Get a shared Reference for the given input.
+        The same names recur constantly (every agent info and agent names its class),
+        so repeated strings share one parsed instance instead of re-parsing and re-allocating.
+        """
+
+        if (isinstance(raw_input, Reference)):
+            return raw_input
+
+        reference = _reference_intern.get(raw_input)
+        if (reference is None):
+            reference = Reference(raw_input)
+            _reference_intern[raw_input] = reference
+
+        return reference
+
     def to_dict(self) -> dict[str, typing.Any]:
-        return vars(self).copy()
+        return {
+            'file_path': self.file_path,
+            'module_name': self.module_name,
+            'short_name': self.short_name,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> typing.Any:
         text = Reference.build_string(data.get('short_name', ''), data.get('file_path', None), data.get('module_name', None))
         return cls(text)
 
+_reference_intern: dict[str, Reference] = {}
+""" Previously parsed references keyed by their raw input string (see Reference.intern()). """
+
 def fetch(reference: Reference | str) -> typing.Any:
     """ Fetch the target of the reference. """
 
@@ -143,6 +174,14 @@ def new_object(reference: Reference | str, *args: typing.Any, **kwargs: typing.A
 
 T = typing.TypeVar('T')
 
+_resolve_cache: dict[tuple[typing.Type, str], typing.Any] = {}
+"""
+Previously resolved (class, reference string) pairs.
+Resolving a reference walks imports and attributes,
+and the same references recur every time an agent is constructed,
+so repeat resolutions are answered with a dict lookup instead.
+"""
+
 def resolve_and_fetch(
         cls: typing.Type,
         raw_object: T | Reference | str,
@@ -151,17 +190,25 @@ def resolve_and_fetch(
     Resolve the given raw object into the specified class.
     If it is already an object of that type, just return it.
     If it is a reference or string, resolve the reference and fetch the reference.
+    Resolutions are cached, so repeated references skip the import/attribute walk.
     """
 
     if (isinstance(raw_object, cls)):
         return raw_object
 
     reference = Reference(typing.cast(Reference | str, raw_object))
+
+    cache_key = (cls, str(reference))
+    result = _resolve_cache.get(cache_key)
+    if (result is not None):
+        return result
+
     result = fetch(reference)
 
     if (not isinstance(result, cls)):
         raise ValueError(f"Target '{reference}' is not of type '{cls}', found type '{type(result)}'.")
 
+    _resolve_cache[cache_key] = result
     return result
 
 def _import_module(reference: Reference) -> typing.Any:
@@ -186,8 +233,12 @@ def get_qualified_name(target: type | object | Reference | str) -> str:
     Names will not always come out clean.
     """
 
-    # If this is a string or reference, just resolve the reference.
-    if (isinstance(target, (Reference, str))):
+    # References already know their string form.
+    if (isinstance(target, Reference)):
+        return str(target)
+
+    # If this is a string, just resolve the reference.
+    if (isinstance(target, str)):
         return str(Reference(target))
 
     return edq.util.reflection.get_qualified_name(target)